@@ -9,23 +9,19 @@ with open("requirements.txt", "r", encoding="utf-8") as fh:
         line.strip() for line in fh if line.strip() and not line.startswith("#")
     ]
 
+project_name = "nkp_cluster_cleaner"
 
 # Get values from __init__.py so we can cut down on re-declaring stuff
-def get_property(prop, project):
-    result = re.search(
-        r'{}\s*=\s*[\'"]([^\'"]*)[\'"]'.format(prop),
-        open("src/" + project + "/__init__.py").read(),
+with open("src/" + project_name + "/__init__.py", "r", encoding="utf-8") as fh:
+    properties = dict(
+        re.findall(r'^(__\w+__)\s*=\s*[\'"]([^\'"]*)[\'"]', fh.read(), re.MULTILINE)
     )
-    return result.group(1)
-
-
-project_name = "nkp_cluster_cleaner"
 
 setup(
     name="nkp-cluster-cleaner",
-    version=get_property("__version__", project_name),
-    author=get_property("__author__", project_name),
-    author_email=get_property("__email__", project_name),
+    version=properties["__version__"],
+    author=properties["__author__"],
+    author_email=properties["__email__"],
     description="A tool to delete CAPI-provided Kubernetes clusters based on label criteria",
     long_description=long_description,
     long_description_content_type="text/markdown",
@@ -4,12 +4,87 @@ Cluster Manager module for interacting with CAPI clusters.
 
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
+import os
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from colorama import Fore, Style
 from .config import ConfigManager
 
+# Maximum number of pooled connections to the Kubernetes API server. The
+# client is shared by every manager, so this covers the web server's request
+# threads plus the concurrent pod log reads.
+KUBE_CONNECTION_POOL_MAXSIZE = 32
+
+# Time periods used by the expires label and grace period, e.g. "2w"
+_TIME_PERIOD_RE = re.compile(r"^(\d+)([dhwy])$")
+
+
+# Shared API clients per kubeconfig path, along with the modification times of
+# the kubeconfig files they were loaded from, so that a rotated kubeconfig or
+# token is picked up without restarting
+_API_CLIENTS: Dict[Optional[str], Tuple[tuple, client.ApiClient]] = {}
+
+
+def _kubeconfig_mtimes(kubeconfig_path: Optional[str]) -> tuple:
+    """
+    Get the modification times of the files making up a kubeconfig.
+
+    Args:
+        kubeconfig_path: Path to kubeconfig file. If None, uses default locations.
+
+    Returns:
+        Modification time of each kubeconfig file, None for missing files
+    """
+    paths = kubeconfig_path or config.KUBE_CONFIG_DEFAULT_LOCATION
+    mtimes = []
+    for path in paths.split(os.pathsep):
+        try:
+            mtimes.append(os.stat(os.path.expanduser(path)).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def get_api_client(kubeconfig_path: Optional[str] = None) -> client.ApiClient:
+    """
+    Return the shared Kubernetes API client for a kubeconfig.
+
+    Loading a kubeconfig and setting up TLS is comparatively expensive, so
+    every manager using the same kubeconfig shares one client and its pool
+    of keep-alive connections. The client is rebuilt when the kubeconfig
+    file changes.
+
+    Args:
+        kubeconfig_path: Path to kubeconfig file. If None, uses default locations.
+
+    Returns:
+        Configured ApiClient instance
+    """
+    mtimes = _kubeconfig_mtimes(kubeconfig_path)
+    cached = _API_CLIENTS.get(kubeconfig_path)
+    if cached and cached[0] == mtimes:
+        return cached[1]
+
+    configuration = client.Configuration()
+    try:
+        if kubeconfig_path:
+            config.load_kube_config(
+                config_file=kubeconfig_path,
+                client_configuration=configuration,
+            )
+        else:
+            config.load_kube_config(client_configuration=configuration)
+    except Exception as e:
+        raise Exception(f"Failed to load kubeconfig: {e}")
+
+    # Allow enough pooled keep-alive connections for concurrent web requests
+    configuration.connection_pool_maxsize = KUBE_CONNECTION_POOL_MAXSIZE
+
+    api_client = client.ApiClient(configuration)
+    _API_CLIENTS[kubeconfig_path] = (mtimes, api_client)
+    return api_client
+
 
 class ClusterManager:
     """Manages CAPI cluster operations."""
@@ -35,17 +110,10 @@ class ClusterManager:
 
     def _load_config(self):
         """Load Kubernetes configuration."""
-        try:
-            if self.kubeconfig_path:
-                config.load_kube_config(config_file=self.kubeconfig_path)
-            else:
-                config.load_kube_config()
-        except Exception as e:
-            raise Exception(f"Failed to load kubeconfig: {e}")
-
-        # Initialize API clients
-        self.core_v1 = client.CoreV1Api()
-        self.custom_api = client.CustomObjectsApi()
+        # Initialize API clients, sharing a single connection pool
+        api_client = get_api_client(self.kubeconfig_path)
+        self.core_v1 = client.CoreV1Api(api_client)
+        self.custom_api = client.CustomObjectsApi(api_client)
 
     def get_nkp_version(self) -> Optional[str]:
         """
@@ -104,60 +172,52 @@ class ClusterManager:
         try:
             if namespace:
                 # List only in the specified namespace
-                namespaces_to_check = [namespace]
+                response = self.custom_api.list_namespaced_custom_object(
+                    group="kommander.mesosphere.io",
+                    version="v1beta1",
+                    namespace=namespace,
+                    plural="kommanderclusters",
+                )
             else:
-                # Get all namespaces
-                namespaces_response = self.core_v1.list_namespace()
-                namespaces_to_check = [
-                    ns.metadata.name for ns in namespaces_response.items
-                ]
-
-            for namespace_name in namespaces_to_check:
-                try:
-                    # List KommanderClusters in this namespace
-                    response = self.custom_api.list_namespaced_custom_object(
-                        group="kommander.mesosphere.io",
-                        version="v1beta1",
-                        namespace=namespace_name,
-                        plural="kommanderclusters",
-                    )
-
-                    kommander_clusters = response.get("items", [])
-                    for kc in kommander_clusters:
-                        # Filter out clusters without spec.clusterRef.capiCluster (attached clusters)
-                        spec = kc.get("spec", {})
-                        cluster_ref = spec.get("clusterRef", {})
-                        capi_cluster = cluster_ref.get("capiCluster")
-
-                        # Skip clusters that don't have a capiCluster dictionary
-                        if not isinstance(capi_cluster, dict):
-                            kc_name = kc.get("metadata", {}).get("name", "unknown")
-                            print(
-                                f"{Fore.CYAN}Info: Skipping attached cluster {kc_name} (no spec.clusterRef.capiCluster){Style.RESET_ALL}"
-                            )
-                            continue
-
-                        # Add namespace info for easier handling
-                        kc["_namespace"] = namespace_name
-                        all_kommander_clusters.append(kc)
-
-                except ApiException as e:
-                    if e.status == 404:
-                        # No KommanderClusters in this namespace, continue
-                        continue
-                    else:
-                        print(
-                            f"{Fore.YELLOW}Warning: Could not list KommanderClusters in namespace {namespace_name}: {e}{Style.RESET_ALL}"
-                        )
-                        continue
+                # A single cluster-wide list rather than one request per namespace
+                response = self.custom_api.list_cluster_custom_object(
+                    group="kommander.mesosphere.io",
+                    version="v1beta1",
+                    plural="kommanderclusters",
+                )
 
         except ApiException as e:
             if e.status == 404:
+                if not namespace:
+                    print(
+                        f"{Fore.YELLOW}Warning: KommanderCluster CRDs not found. Is Kommander installed?{Style.RESET_ALL}"
+                    )
+                # No KommanderClusters in this namespace
+                return []
+            if namespace:
                 print(
-                    f"{Fore.YELLOW}Warning: KommanderCluster CRDs not found. Is Kommander installed?{Style.RESET_ALL}"
+                    f"{Fore.YELLOW}Warning: Could not list KommanderClusters in namespace {namespace}: {e}{Style.RESET_ALL}"
                 )
                 return []
-            raise Exception(f"Failed to list namespaces: {e}")
+            raise Exception(f"Failed to list KommanderClusters: {e}")
+
+        for kc in response.get("items", []):
+            # Filter out clusters without spec.clusterRef.capiCluster (attached clusters)
+            spec = kc.get("spec", {})
+            cluster_ref = spec.get("clusterRef", {})
+            capi_cluster = cluster_ref.get("capiCluster")
+
+            # Skip clusters that don't have a capiCluster dictionary
+            if not isinstance(capi_cluster, dict):
+                kc_name = kc.get("metadata", {}).get("name", "unknown")
+                print(
+                    f"{Fore.CYAN}Info: Skipping attached cluster {kc_name} (no spec.clusterRef.capiCluster){Style.RESET_ALL}"
+                )
+                continue
+
+            # Add namespace info for easier handling
+            kc["_namespace"] = namespace or kc.get("metadata", {}).get("namespace")
+            all_kommander_clusters.append(kc)
 
         return all_kommander_clusters
 
@@ -169,11 +229,13 @@ class ClusterManager:
             True if KommanderCluster CRDs are available
         """
         try:
-            # Try to list KommanderClusters to check if CRDs exist
+            # Try to list KommanderClusters to check if CRDs exist, a single
+            # item is enough to prove the API is being served
             self.custom_api.list_cluster_custom_object(
                 group="kommander.mesosphere.io",
                 version="v1beta1",
                 plural="kommanderclusters",
+                limit=1,
             )
             return True
         except ApiException as e:
@@ -366,6 +428,44 @@ class ClusterManager:
                 )
                 return False
 
+    def get_existing_capi_clusters(
+        self, cluster_refs: List[Tuple[str, str]]
+    ) -> Set[Tuple[str, str]]:
+        """
+        Find which of the referenced CAPI clusters exist.
+
+        When more than one cluster needs checking, a single cluster-wide list
+        replaces one request per cluster. If listing fails, each cluster is
+        verified individually instead.
+
+        Args:
+            cluster_refs: List of (cluster_name, cluster_namespace) tuples
+
+        Returns:
+            Set of the given (cluster_name, cluster_namespace) tuples that exist
+        """
+        cluster_refs = set(cluster_refs)
+
+        if len(cluster_refs) > 1:
+            try:
+                response = self.custom_api.list_cluster_custom_object(
+                    group="cluster.x-k8s.io", version="v1beta1", plural="clusters"
+                )
+                return cluster_refs & {
+                    (item["metadata"]["name"], item["metadata"]["namespace"])
+                    for item in response.get("items", [])
+                }
+            except ApiException as e:
+                print(
+                    f"{Fore.YELLOW}Warning: Could not list CAPI clusters, verifying individually: {e}{Style.RESET_ALL}"
+                )
+
+        return {
+            (cluster_name, cluster_namespace)
+            for cluster_name, cluster_namespace in cluster_refs
+            if self.verify_capi_cluster_exists(cluster_name, cluster_namespace)
+        }
+
     def _parse_time_period(self, time_period: str, creation_timestamp: str) -> datetime:
         """
         Parse time period value and calculate target time based on creation timestamp.
@@ -384,8 +484,7 @@ class ClusterManager:
         time_period = time_period.strip()
 
         # Parse number and unit
-        pattern = r"^(\d+)([dhwy])$"
-        match = re.match(pattern, time_period.lower())
+        match = _TIME_PERIOD_RE.match(time_period.lower())
 
         if not match:
             raise ValueError(
@@ -514,8 +613,7 @@ class ClusterManager:
             (kommander_cluster_with_capi_info, reason) tuples
         """
         all_kommander_clusters = self.list_all_kommander_clusters(namespace)
-        clusters_to_delete = []
-        excluded_clusters = []
+        classified_clusters = []
 
         for kc in all_kommander_clusters:
             should_delete, reason = self.kommander_cluster_matches_criteria(kc)
@@ -530,11 +628,29 @@ class ClusterManager:
                 "capi_cluster_namespace": cluster_namespace,
                 "labels": self.get_cluster_labels(kc),
             }
+            classified_clusters.append((combined_info, should_delete, reason))
+
+        # Verify the CAPI clusters of all deletion candidates at once
+        existing_capi_clusters = self.get_existing_capi_clusters(
+            [
+                (info["capi_cluster_name"], info["capi_cluster_namespace"])
+                for info, should_delete, _ in classified_clusters
+                if should_delete
+                and info["capi_cluster_name"]
+                and info["capi_cluster_namespace"]
+            ]
+        )
+
+        clusters_to_delete = []
+        excluded_clusters = []
+
+        for combined_info, should_delete, reason in classified_clusters:
+            cluster_name = combined_info["capi_cluster_name"]
+            cluster_namespace = combined_info["capi_cluster_namespace"]
 
             if should_delete:
                 if cluster_name and cluster_namespace:
-                    # Verify the CAPI cluster exists
-                    if self.verify_capi_cluster_exists(cluster_name, cluster_namespace):
+                    if (cluster_name, cluster_namespace) in existing_capi_clusters:
                         clusters_to_delete.append((combined_info, reason))
                     else:
                         # CAPI cluster doesn't exist, exclude for safety
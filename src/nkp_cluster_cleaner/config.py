@@ -2,9 +2,11 @@
 Configuration management for cluster deletion criteria.
 """
 
+import os
 import yaml
 import re
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
 from dataclasses import dataclass, field
 
 # Because dumping YAML with reserved characters like [] is difficult otherwise
@@ -35,11 +37,11 @@ class ExtraLabel:
         if not self.regex:
             return True
 
-        try:
-            return bool(re.match(self.regex, value))
-        except re.error:
+        compiled = _compile_label_regex(self.regex)
+        if compiled is None:
             # Invalid regex pattern, treat as no validation
             return True
+        return compiled.match(value) is not None
 
 
 @dataclass
@@ -56,6 +58,64 @@ class DeletionCriteria:
     extra_labels: List[ExtraLabel] = field(default_factory=list)
 
 
+# Parsed criteria per config file path along with the file's modification time,
+# so that repeatedly loading an unchanged config file skips the YAML parse
+_CRITERIA_CACHE: Dict[str, Tuple[int, DeletionCriteria]] = {}
+
+
+# Backreferences and conditional group references (e.g. '(?(1)a|b)') would
+# point at the wrong group once patterns are combined
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Flags of a pattern without any inline flags, used to spot patterns that set
+# their own (e.g. '(?i)foo'). Before Python 3.11 such a flag applies to the
+# whole combined pattern instead of raising an error.
+_DEFAULT_PATTERN_FLAGS = re.compile("").flags
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Optional[Pattern]:
+    """
+    Combine regex patterns into a single compiled alternation.
+
+    Args:
+        patterns: Regex patterns to combine
+
+    Returns:
+        Compiled pattern that matches wherever any of the patterns would, or
+        None if the patterns can't be combined (e.g. inline global flags)
+    """
+    if not all(
+        isinstance(pattern, str) and not _BACKREFERENCE_RE.search(pattern)
+        for pattern in patterns
+    ):
+        return None
+
+    try:
+        if any(re.compile(p).flags != _DEFAULT_PATTERN_FLAGS for p in patterns):
+            return None
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _compile_label_regex(regex: str) -> Optional[Pattern]:
+    """
+    Compile the regex an extra label's value must match.
+
+    Args:
+        regex: Regex pattern from the configuration
+
+    Returns:
+        Compiled pattern, or None if the pattern is invalid
+    """
+    try:
+        return re.compile(regex)
+    except re.error:
+        return None
+
+
 class ConfigManager:
     """Manages configuration for cluster deletion criteria."""
 
@@ -80,10 +140,18 @@ class ConfigManager:
             config_file: Path to YAML configuration file
         """
         try:
+            path = os.path.abspath(config_file)
+            mtime = os.stat(path).st_mtime_ns
+            cached = _CRITERIA_CACHE.get(path)
+            if cached and cached[0] == mtime:
+                self.criteria = cached[1]
+                return
+
             with open(config_file, "r") as f:
                 config_data = yaml.safe_load(f)
 
             self.criteria = self._parse_config(config_data)
+            _CRITERIA_CACHE[path] = (mtime, self.criteria)
         except Exception as e:
             raise Exception(f"Failed to load config file {config_file}: {e}")
 
@@ -180,17 +248,31 @@ class ConfigManager:
         Returns:
             True if cluster should be protected from deletion
         """
-        # Check if cluster name matches any protection pattern
-        for pattern in self.criteria.protected_cluster_patterns:
-            if re.match(pattern, cluster_name):
-                return True
+        # Check if cluster name matches any protection pattern, or namespace
+        # matches any exclusion pattern
+        return self._matches_any(
+            self.criteria.protected_cluster_patterns, cluster_name
+        ) or self._matches_any(self.criteria.excluded_namespace_patterns, namespace)
+
+    @staticmethod
+    def _matches_any(patterns: List[str], value: str) -> bool:
+        """
+        Check if a value matches any of the given regex patterns.
+
+        Args:
+            patterns: Regex patterns, matched from the start of the value
+            value: Value to check
 
-        # Check if namespace matches any exclusion pattern
-        for pattern in self.criteria.excluded_namespace_patterns:
-            if re.match(pattern, namespace):
-                return True
+        Returns:
+            True if at least one pattern matches
+        """
+        if not patterns:
+            return False
 
-        return False
+        combined = _compile_patterns(tuple(patterns))
+        if combined is None:
+            return any(re.match(pattern, value) for pattern in patterns)
+        return combined.match(value) is not None
 
     def validate_extra_labels(self, labels: Dict[str, str]) -> List[str]:
         """
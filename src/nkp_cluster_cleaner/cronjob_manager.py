@@ -2,11 +2,23 @@
 CronJob Manager module for tracking scheduled cluster tasks.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 from colorama import Fore, Style
+from .cache import TTLCache
+from .cluster_manager import get_api_client
+
+# Upper bound on concurrent log reads, shared by all requests to a manager
+LOG_FETCH_WORKERS = 16
+
+# How long the result of checking a CronJob's label is reused
+CRONJOB_LABEL_CACHE_TTL = 60
+
+# How long the owning CronJobs of a Job are reused, owner references never change
+JOB_OWNER_CACHE_TTL = 300
 
 
 class CronJobManager:
@@ -22,23 +34,23 @@ class CronJobManager:
         self.kubeconfig_path = kubeconfig_path
         self._load_config()
 
-    def _load_config(self):
-        """Load Kubernetes configuration."""
-        try:
-            if self.kubeconfig_path:
-                from kubernetes import config
+        # Whether each (namespace, name) CronJob carries our label
+        self._managed_cronjob_cache = TTLCache(maxsize=256, ttl=CRONJOB_LABEL_CACHE_TTL)
 
-                config.load_kube_config(config_file=self.kubeconfig_path)
-            else:
-                from kubernetes import config
+        # Names of the CronJobs owning each (namespace, name) Job
+        self._job_owner_cache = TTLCache(maxsize=256, ttl=JOB_OWNER_CACHE_TTL)
 
-                config.load_kube_config()
-        except Exception as e:
-            raise Exception(f"Failed to load kubeconfig: {e}")
+        # Threads are only started once logs are first fetched
+        self._log_executor = ThreadPoolExecutor(
+            max_workers=LOG_FETCH_WORKERS, thread_name_prefix="pod-logs"
+        )
 
-        # Initialize API clients
-        self.batch_v1 = client.BatchV1Api()
-        self.core_v1 = client.CoreV1Api()
+    def _load_config(self):
+        """Load Kubernetes configuration."""
+        # Initialize API clients, sharing the connection pool of other managers
+        api_client = get_api_client(self.kubeconfig_path)
+        self.batch_v1 = client.BatchV1Api(api_client)
+        self.core_v1 = client.CoreV1Api(api_client)
 
     def get_nkp_cronjobs(self, namespace: str = "kommander") -> List[Dict]:
         """
@@ -100,52 +112,72 @@ class CronJobManager:
         Returns:
             List of Job objects with status information
         """
+        return self.get_jobs_for_cronjobs([cronjob_name], namespace, limit)[
+            cronjob_name
+        ]
+
+    def get_jobs_for_cronjobs(
+        self, cronjob_names: List[str], namespace: str = "kommander", limit: int = 10
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get recent Jobs created by each of several CronJobs.
+
+        The Jobs in the namespace are listed once and grouped by their owning
+        CronJob, instead of listing them again for every CronJob.
+
+        Args:
+            cronjob_names: Names of the CronJobs
+            namespace: Namespace to search
+            limit: Maximum number of jobs to return per CronJob
+
+        Returns:
+            Dictionary of CronJob name to list of Job objects with status information
+        """
+        jobs_by_cronjob = {name: [] for name in cronjob_names}
+        if not jobs_by_cronjob:
+            return jobs_by_cronjob
+
         try:
             # Get all jobs in the namespace
             jobs = self.batch_v1.list_namespaced_job(namespace=namespace)
-
-            cronjob_jobs = []
-            for job in jobs.items:
-                # Check if this job was created by our cronjob
-                if job.metadata.owner_references:
-                    for owner in job.metadata.owner_references:
-                        if owner.kind == "CronJob" and owner.name == cronjob_name:
-                            job_info = {
-                                "name": job.metadata.name,
-                                "namespace": job.metadata.namespace,
-                                "cronjob_name": cronjob_name,
-                                "status": self._get_job_status(job),
-                                "start_time": job.status.start_time
-                                if job.status
-                                else None,
-                                "completion_time": job.status.completion_time
-                                if job.status
-                                else None,
-                                "duration": self._calculate_duration(job),
-                                "creation_timestamp": job.metadata.creation_timestamp,
-                                "active_pods": job.status.active or 0
-                                if job.status
-                                else 0,
-                                "succeeded_pods": job.status.succeeded or 0
-                                if job.status
-                                else 0,
-                                "failed_pods": job.status.failed or 0
-                                if job.status
-                                else 0,
-                                "labels": job.metadata.labels or {},
-                            }
-                            cronjob_jobs.append(job_info)
-                            break
-
-            # Sort by creation time (newest first) and limit
-            cronjob_jobs.sort(key=lambda x: x["creation_timestamp"], reverse=True)
-            return cronjob_jobs[:limit]
-
         except ApiException as e:
             print(
-                f"{Fore.RED}Failed to list Jobs for CronJob {cronjob_name}: {e}{Style.RESET_ALL}"
+                f"{Fore.RED}Failed to list Jobs for CronJob {', '.join(cronjob_names)}: {e}{Style.RESET_ALL}"
             )
-            return []
+            return jobs_by_cronjob
+
+        for job in jobs.items:
+            # Check if this job was created by one of our cronjobs
+            for owner in job.metadata.owner_references or []:
+                if owner.kind == "CronJob" and owner.name in jobs_by_cronjob:
+                    jobs_by_cronjob[owner.name].append(
+                        {
+                            "name": job.metadata.name,
+                            "namespace": job.metadata.namespace,
+                            "cronjob_name": owner.name,
+                            "status": self._get_job_status(job),
+                            "start_time": job.status.start_time if job.status else None,
+                            "completion_time": job.status.completion_time
+                            if job.status
+                            else None,
+                            "duration": self._calculate_duration(job),
+                            "creation_timestamp": job.metadata.creation_timestamp,
+                            "active_pods": job.status.active or 0 if job.status else 0,
+                            "succeeded_pods": job.status.succeeded or 0
+                            if job.status
+                            else 0,
+                            "failed_pods": job.status.failed or 0 if job.status else 0,
+                            "labels": job.metadata.labels or {},
+                        }
+                    )
+                    break
+
+        # Sort by creation time (newest first) and limit
+        for name, cronjob_jobs in jobs_by_cronjob.items():
+            cronjob_jobs.sort(key=lambda x: x["creation_timestamp"], reverse=True)
+            jobs_by_cronjob[name] = cronjob_jobs[:limit]
+
+        return jobs_by_cronjob
 
     def get_job_pods(self, job_name: str, namespace: str = "kommander") -> List[Dict]:
         """
@@ -217,21 +249,165 @@ class CronJobManager:
         Returns:
             Log content as string
         """
+        # First, validate that this pod was created by one of our jobs
+        if not self._validate_pod_ownership(pod_name, namespace, job_name):
+            return "Access denied: Pod was not created by an nkp-cluster-cleaner job"
+
+        return self._read_pod_logs(pod_name, container_name, namespace, tail_lines)
+
+    def get_job_logs(
+        self, job_name: str, namespace: str = "kommander", tail_lines: int = 100
+    ) -> List[Dict]:
+        """
+        Get logs for every container of every pod created by a Job.
+
+        The caller is expected to have checked the Job with is_managed_job().
+        Pod ownership is verified from the owner references returned by the
+        pod list, so no further reads are needed before fetching the logs,
+        which are then read concurrently on the manager's shared thread pool.
+
+        Args:
+            job_name: Name of the Job
+            namespace: Namespace of the Job
+            tail_lines: Number of recent log lines to retrieve per container
+
+        Returns:
+            List of dicts with pod_name, container_name and logs keys
+        """
+        try:
+            pods = self.core_v1.list_namespaced_pod(
+                namespace=namespace, label_selector=f"job-name={job_name}"
+            )
+        except ApiException as e:
+            print(
+                f"{Fore.RED}Failed to list Pods for Job {job_name}: {e}{Style.RESET_ALL}"
+            )
+            return []
+
+        targets = []
+        for pod in pods.items:
+            # The label selector alone could match pods created by something else
+            if not any(
+                owner.kind == "Job" and owner.name == job_name
+                for owner in pod.metadata.owner_references or []
+            ):
+                continue
+
+            if pod.status and pod.status.container_statuses:
+                for container in pod.status.container_statuses:
+                    targets.append((pod.metadata.name, container.name))
+            else:
+                # Single container pod
+                targets.append((pod.metadata.name, None))
+
+        def read_logs(target):
+            return self._read_pod_logs(target[0], target[1], namespace, tail_lines)
+
+        if len(targets) > 1:
+            logs = self._log_executor.map(read_logs, targets)
+        else:
+            # Nothing to overlap, skip the hand-off to the pool
+            logs = map(read_logs, targets)
+        return [
+            {
+                "pod_name": pod_name,
+                "container_name": container_name or "default",
+                "logs": pod_logs,
+            }
+            for (pod_name, container_name), pod_logs in zip(targets, logs)
+        ]
+
+    def is_managed_job(self, job_name: str, namespace: str = "kommander") -> bool:
+        """
+        Check whether a Job was created by one of our CronJobs.
+
+        The owners of a Job are remembered, so repeated checks of the same
+        Job (e.g. refreshing its logs) don't read it again.
+
+        Args:
+            job_name: Name of the Job
+            namespace: Namespace of the Job
+
+        Returns:
+            True if the Job is owned by a CronJob carrying our label
+
+        Raises:
+            ApiException: If the Job itself cannot be read
+        """
+        key = (namespace, job_name)
+        owner_cronjobs = self._job_owner_cache.get(key)
+        if owner_cronjobs is None:
+            job = self.batch_v1.read_namespaced_job(name=job_name, namespace=namespace)
+            owner_cronjobs = tuple(
+                owner.name
+                for owner in job.metadata.owner_references or []
+                if owner.kind == "CronJob"
+            )
+            self._job_owner_cache.set(key, owner_cronjobs)
+
+        return any(
+            self._is_managed_cronjob(cronjob_name, namespace)
+            for cronjob_name in owner_cronjobs
+        )
+
+    def _is_managed_cronjob(self, cronjob_name: str, namespace: str) -> bool:
+        """
+        Check whether a CronJob carries the nkp-cluster-cleaner label.
+
+        Results are reused for a short while, our CronJobs rarely change.
+        Failed lookups are not cached.
+
+        Args:
+            cronjob_name: Name of the CronJob
+            namespace: Namespace of the CronJob
+
+        Returns:
+            True if the CronJob exists and has our label, False otherwise
+        """
+        key = (namespace, cronjob_name)
+        is_managed = self._managed_cronjob_cache.get(key)
+        if is_managed is not None:
+            return is_managed
+
         try:
-            # First, validate that this pod was created by one of our jobs
-            if not self._validate_pod_ownership(pod_name, namespace, job_name):
-                return (
-                    "Access denied: Pod was not created by an nkp-cluster-cleaner job"
-                )
+            cronjob = self.batch_v1.read_namespaced_cron_job(
+                name=cronjob_name, namespace=namespace
+            )
+        except ApiException:
+            return False
+
+        labels = cronjob.metadata.labels or {}
+        is_managed = labels.get("app") == "nkp-cluster-cleaner"
+        self._managed_cronjob_cache.set(key, is_managed)
+        return is_managed
+
+    def _read_pod_logs(
+        self,
+        pod_name: str,
+        container_name: Optional[str],
+        namespace: str,
+        tail_lines: int,
+    ) -> str:
+        """
+        Read logs from a pod/container without any ownership checks.
+
+        Args:
+            pod_name: Name of the pod
+            container_name: Name of the container, or None for single-container pods
+            namespace: Namespace of the pod
+            tail_lines: Number of recent log lines to retrieve
 
-            logs = self.core_v1.read_namespaced_pod_log(
+        Returns:
+            Log content, or an error message if the logs could not be read
+        """
+        try:
+            return self.core_v1.read_namespaced_pod_log(
                 name=pod_name,
                 namespace=namespace,
                 container=container_name,
                 tail_lines=tail_lines,
                 timestamps=True,
             )
-            return logs
         except ApiException as e:
             return f"Failed to retrieve logs: {e}"
 
@@ -273,35 +449,7 @@ class CronJobManager:
 
             # Now check if this job was created by one of our CronJobs
             try:
-                job = self.batch_v1.read_namespaced_job(
-                    name=job_owner, namespace=namespace
-                )
-
-                # Check if job has owner references to CronJobs
-                if not job.metadata.owner_references:
-                    return False
-
-                # Find the CronJob that owns this job
-                for owner in job.metadata.owner_references:
-                    if owner.kind == "CronJob":
-                        cronjob_name = owner.name
-
-                        # Check if this CronJob has our label
-                        try:
-                            cronjob = self.batch_v1.read_namespaced_cron_job(
-                                name=cronjob_name, namespace=namespace
-                            )
-
-                            # Validate the CronJob has our label
-                            labels = cronjob.metadata.labels or {}
-                            if labels.get("app") == "nkp-cluster-cleaner":
-                                return True
-
-                        except ApiException:
-                            continue
-
-                return False
-
+                return self.is_managed_job(job_owner, namespace)
             except ApiException:
                 return False
 
@@ -488,10 +636,12 @@ class CronJobManager:
         active_cronjobs = len([cj for cj in cronjobs if not cj["suspend"]])
         suspended_cronjobs = len([cj for cj in cronjobs if cj["suspend"]])
 
-        # Get recent jobs for all cronjobs
+        # Get recent jobs for all cronjobs, with a single Job listing
+        jobs_by_cronjob = self.get_jobs_for_cronjobs(
+            [cj["name"] for cj in cronjobs], namespace, limit=5
+        )
         all_recent_jobs = []
-        for cj in cronjobs:
-            jobs = self.get_jobs_for_cronjob(cj["name"], namespace, limit=5)
+        for jobs in jobs_by_cronjob.values():
             all_recent_jobs.extend(jobs)
 
         # Sort all jobs by creation time
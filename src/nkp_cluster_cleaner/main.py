@@ -6,12 +6,10 @@ Main entry point for the NKP Cluster Cleaner tool.
 import click
 from colorama import init, Fore, Style
 from .config import ConfigManager
-from .redis_data_collector import RedisDataCollector
 
-# These commands were making this file too long and hard to read
-from .commands.notify import execute_notify_command
-from .commands.list_clusters import execute_list_clusters_command
-from .commands.delete_clusters import execute_delete_clusters_command
+# Command implementations live in the commands package to keep this file readable.
+# They (and the Kubernetes/Redis clients they pull in) are imported inside each
+# command so that `--help` and other lightweight invocations start quickly.
 
 # Initialize colorama
 init()
@@ -142,6 +140,8 @@ def cli():
 )
 def list_clusters(kubeconfig, config, namespace, no_exclusions, grace):
     """List CAPI clusters that match deletion criteria."""
+    from .commands.list_clusters import execute_list_clusters_command
+
     execute_list_clusters_command(
         kubeconfig=kubeconfig,
         config=config,
@@ -186,6 +186,8 @@ def delete_clusters(
     **kwargs,
 ):
     """Delete CAPI clusters that match deletion criteria."""
+    from .commands.delete_clusters import execute_delete_clusters_command
+
     # Filter out None values from kwargs to only pass relevant backend parameters
     backend_params = {k: v for k, v in kwargs.items() if v is not None}
 
@@ -249,6 +251,8 @@ def notify(
     **kwargs,
 ):
     """Send notifications for clusters approaching deletion."""
+    from .commands.notify import execute_notify_command
+
     # Filter out None values from kwargs to only pass relevant backend parameters
     backend_params = {k: v for k, v in kwargs.items() if v is not None}
 
@@ -298,6 +302,18 @@ def generate_config(output_file):
     "--port", envvar="PORT", default=8080, help="Port to bind to (default: 8080)"
 )
 @click.option("--debug", envvar="DEBUG", is_flag=True, help="Enable debug mode")
+@click.option(
+    "--workers",
+    envvar="WORKERS",
+    default=4,
+    help="Number of web server worker processes (default: 4)",
+)
+@click.option(
+    "--threads",
+    envvar="THREADS",
+    default=8,
+    help="Number of request threads per worker (default: 8)",
+)
 @click.option(
     "--prefix",
     envvar="PREFIX",
@@ -322,6 +338,8 @@ def serve(
     host,
     port,
     debug,
+    workers,
+    threads,
     prefix,
     grace,
     redis_host,
@@ -349,6 +367,8 @@ def serve(
             redis_username=redis_username,
             redis_password=redis_password,
             no_redis=no_redis,
+            workers=workers,
+            threads=threads,
         )
     except KeyboardInterrupt:
         click.echo(f"\n{Fore.YELLOW}Server stopped by user.{Style.RESET_ALL}")
@@ -389,6 +409,8 @@ def collect_analytics(
 ):
     """Collect analytics snapshot for historical tracking and reporting."""
     try:
+        from .redis_data_collector import RedisDataCollector
+
         # Initialize configuration and data collector
         config_manager = ConfigManager(config) if config else ConfigManager()
         data_collector = RedisDataCollector(
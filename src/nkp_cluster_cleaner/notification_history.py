@@ -5,6 +5,7 @@ Notification History module for storing notification history in Redis to avoid d
 import redis
 from typing import List, Tuple, Optional
 from colorama import Fore, Style
+from .redis_analytics_service import get_connection_pool
 
 
 class NotificationHistory:
@@ -35,7 +36,9 @@ class NotificationHistory:
             "decode_responses": True,
             "socket_connect_timeout": 5,
             "socket_timeout": 5,
+            "socket_keepalive": True,
             "retry_on_timeout": True,
+            "health_check_interval": 30,
         }
 
         if redis_username:
@@ -43,7 +46,12 @@ class NotificationHistory:
         if redis_password:
             redis_kwargs["password"] = redis_password
 
-        self.redis_client = redis.Redis(**redis_kwargs)
+        # Same settings as the analytics service, so both share one pool. This
+        # includes its keepalive and 30s idle health check, which stale
+        # connections from the shared pool benefit from here as well.
+        self.redis_client = redis.Redis(
+            connection_pool=get_connection_pool(**redis_kwargs)
+        )
 
         # Test connection
         try:
@@ -107,16 +115,18 @@ class NotificationHistory:
         Returns:
             List of clusters that haven't been notified yet
         """
-        new_clusters = []
-
-        for cluster_info, elapsed_percentage, expiry_time in clusters:
+        # Check every cluster in a single round-trip
+        pipe = self.redis_client.pipeline(transaction=False)
+        for cluster_info, _, _ in clusters:
             cluster_name = cluster_info.get("capi_cluster_name", "unknown")
             namespace = cluster_info.get("capi_cluster_namespace", "unknown")
+            pipe.sismember(self._get_cluster_key(cluster_name, namespace), severity)
 
-            if not self.has_been_notified(cluster_name, namespace, severity):
-                new_clusters.append((cluster_info, elapsed_percentage, expiry_time))
-
-        return new_clusters
+        return [
+            cluster
+            for cluster, notified in zip(clusters, pipe.execute())
+            if not notified
+        ]
 
     def mark_clusters_as_notified(self, clusters: List[Tuple], severity: str):
         """
@@ -173,30 +183,34 @@ class NotificationHistory:
         """
         try:
             keys = self.redis_client.keys("notifications:cluster:*")
-            clusters = []
 
+            # Parse namespace and cluster name from key
+            # Format: notifications:cluster:namespace:clustername
+            parsed_keys = []
             for key in keys:
-                # Parse namespace and cluster name from key
-                # Format: notifications:cluster:namespace:clustername
                 parts = key.split(":")
                 if len(parts) >= 4:
-                    namespace = parts[2]
-                    cluster_name = ":".join(
-                        parts[3:]
-                    )  # Handle cluster names with colons
-
-                    # Get notification levels for this cluster
-                    severities = self.redis_client.smembers(key)
-                    ttl = self.redis_client.ttl(key)
-
-                    clusters.append(
-                        {
-                            "cluster_name": cluster_name,
-                            "namespace": namespace,
-                            "severities": list(severities),
-                            "ttl_seconds": ttl,
-                        }
-                    )
+                    # Handle cluster names with colons
+                    parsed_keys.append((key, parts[2], ":".join(parts[3:])))
+
+            # Get notification levels and TTLs for all clusters in one round-trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, _, _ in parsed_keys:
+                pipe.smembers(key)
+                pipe.ttl(key)
+            results = pipe.execute()
+
+            clusters = []
+            for index, (key, namespace, cluster_name) in enumerate(parsed_keys):
+                severities, ttl = results[2 * index], results[2 * index + 1]
+                clusters.append(
+                    {
+                        "cluster_name": cluster_name,
+                        "namespace": namespace,
+                        "severities": list(severities),
+                        "ttl_seconds": ttl,
+                    }
+                )
 
             return clusters
 
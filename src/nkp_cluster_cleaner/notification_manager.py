@@ -20,6 +20,7 @@ class NotificationManager:
         kubeconfig_path: Optional[str] = None,
         config_manager: Optional[ConfigManager] = None,
         grace_period: Optional[str] = None,
+        cluster_manager: Optional[ClusterManager] = None,
     ):
         """
         Initialize the notification manager.
@@ -28,10 +29,11 @@ class NotificationManager:
             kubeconfig_path: Path to kubeconfig file. If None, uses default locations.
             config_manager: Configuration manager instance
             grace_period: Grace period for newly created clusters (e.g., "1d", "4h", "2w", "1y")
+            cluster_manager: Existing cluster manager to reuse instead of creating one
         """
         self.kubeconfig_path = kubeconfig_path
         self.config_manager = config_manager or ConfigManager()
-        self.cluster_manager = ClusterManager(
+        self.cluster_manager = cluster_manager or ClusterManager(
             kubeconfig_path, config_manager, grace_period=grace_period
         )
 
@@ -4,13 +4,23 @@ Prometheus metrics service for NKP Cluster Cleaner.
 This module generates Prometheus-formatted metrics from analytics data.
 """
 
+import threading
+import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+from colorama import Fore, Style
 from .redis_analytics_service import RedisAnalyticsService
 import nkp_cluster_cleaner
 
 __version__ = nkp_cluster_cleaner.__version__
 
+# Seconds between background refreshes of the metrics output
+METRICS_REFRESH_INTERVAL = 15
+
+# Age in seconds after which the metrics are regenerated on request, in case
+# the background refresh has stopped or keeps failing
+METRICS_STALE_AFTER = 60
+
 
 class PrometheusMetricsService:
     """Service for generating Prometheus metrics from analytics data."""
@@ -23,6 +33,66 @@ class PrometheusMetricsService:
             analytics_service: Optional analytics service instance
         """
         self.analytics_service = analytics_service
+        self._latest_metrics: Optional[str] = None
+        self._latest_generated_at: Optional[float] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def get_latest_metrics(self) -> str:
+        """
+        Get the most recently generated metrics.
+
+        The first call generates the metrics and starts a background thread
+        that keeps regenerating them, so scrapes are served from memory and
+        don't each query Redis. If the metrics have gone stale they are
+        regenerated inline and the background thread is restarted.
+
+        Returns:
+            Prometheus metrics as a string
+        """
+        if self._is_stale():
+            with self._lock:
+                if self._is_stale():
+                    self._refresh()
+                    self.start_background_refresh()
+        return self._latest_metrics
+
+    def _is_stale(self) -> bool:
+        """Check whether the metrics are missing or older than allowed."""
+        return (
+            self._latest_generated_at is None
+            or time.monotonic() - self._latest_generated_at > METRICS_STALE_AFTER
+        )
+
+    def _refresh(self):
+        """Regenerate the metrics and record when they were generated."""
+        self._latest_metrics = self.generate_metrics()
+        self._latest_generated_at = time.monotonic()
+
+    def start_background_refresh(self, interval: float = METRICS_REFRESH_INTERVAL):
+        """
+        Start a daemon thread that regenerates the metrics periodically.
+
+        Args:
+            interval: Seconds between refreshes
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+
+        def refresh_loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    self._refresh()
+                except Exception as e:
+                    print(
+                        f"{Fore.YELLOW}Warning: Could not refresh metrics: {e}{Style.RESET_ALL}"
+                    )
+
+        self._refresh_thread = threading.Thread(
+            target=refresh_loop, name="metrics-refresh", daemon=True
+        )
+        self._refresh_thread.start()
 
     def generate_metrics(self) -> str:
         """
@@ -35,14 +105,15 @@ class PrometheusMetricsService:
             return self._generate_basic_metrics()
 
         try:
-            # Get analytics data
-            dashboard_summary = self.analytics_service.get_dashboard_summary()
-            cluster_trends_7d = self.analytics_service.get_cluster_trends(7)
-            compliance_stats = self.analytics_service.get_compliance_stats(30)
-            deletion_activity = self.analytics_service.get_deletion_activity(14)
-            namespace_activity = self.analytics_service.get_namespace_activity(30)
-            owner_distribution = self.analytics_service.get_owner_distribution(30)
-            expiration_analysis = self.analytics_service.get_expiration_analysis(30)
+            # Get analytics data, the bundle reads the snapshots only once
+            analytics_data = self.analytics_service.get_analytics_bundle()
+            dashboard_summary = analytics_data["dashboard_summary"]
+            cluster_trends_7d = analytics_data["cluster_trends_7d"]
+            compliance_stats = analytics_data["compliance_stats"]
+            deletion_activity = analytics_data["deletion_activity"]
+            namespace_activity = analytics_data["namespace_activity"]
+            owner_distribution = analytics_data["owner_distribution"]
+            expiration_analysis = analytics_data["expiration_analysis"]
             database_stats = self.analytics_service.get_database_stats()
 
             metrics_lines = []
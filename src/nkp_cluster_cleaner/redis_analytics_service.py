@@ -5,12 +5,131 @@ This module provides methods to query historical analytics data stored in Redis
 for use in the web UI.
 """
 
+import atexit
+import base64
+import zlib
 import redis
-import json
+import orjson
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from collections import defaultdict, Counter
 
+from .cache import TTLCache
+
+# How long the analytics dashboard data is reused. Snapshots are only taken
+# by the scheduled collector, so recomputing it on every request is wasted.
+ANALYTICS_CACHE_TTL = 60
+
+# Marks snapshots stored zlib-compressed and base64-encoded, older snapshots
+# are plain JSON
+SNAPSHOT_COMPRESSED_PREFIX = "z1:"
+SNAPSHOT_COMPRESSION_LEVEL = 6
+
+# Maximum number of snapshots fetched by a single MGET, so a month of hourly
+# snapshots doesn't come back as one huge reply that blocks other clients
+SNAPSHOT_MGET_BATCH_SIZE = 100
+
+
+def encode_snapshot(snapshot_data: Dict[str, Any]) -> str:
+    """
+    Encode an analytics snapshot for storage in Redis.
+
+    Snapshots repeat the same keys throughout and compress to well under
+    half their size. The result stays ASCII text so it can be read by
+    clients that decode responses.
+
+    Args:
+        snapshot_data: Snapshot to encode
+
+    Returns:
+        Compressed snapshot
+    """
+    compressed = zlib.compress(
+        orjson.dumps(snapshot_data, option=orjson.OPT_NON_STR_KEYS),
+        SNAPSHOT_COMPRESSION_LEVEL,
+    )
+    return SNAPSHOT_COMPRESSED_PREFIX + base64.b64encode(compressed).decode("ascii")
+
+
+def decode_snapshot(value: str) -> Dict[str, Any]:
+    """
+    Decode an analytics snapshot read from Redis.
+
+    Args:
+        value: Stored snapshot, compressed or plain JSON
+
+    Returns:
+        The snapshot
+
+    Raises:
+        ValueError: If the stored value is corrupt
+    """
+    if not value.startswith(SNAPSHOT_COMPRESSED_PREFIX):
+        return orjson.loads(value)
+
+    try:
+        data = zlib.decompress(
+            base64.b64decode(value[len(SNAPSHOT_COMPRESSED_PREFIX) :])
+        )
+    except zlib.error as e:
+        raise ValueError(f"Invalid compressed snapshot: {e}")
+    return orjson.loads(data)
+
+
+def mget_snapshots(redis_client: redis.Redis, keys: List[str]) -> List[Optional[str]]:
+    """
+    Fetch stored snapshots in bounded MGET batches.
+
+    The batches are sent in one pipeline, so this is still a single round trip.
+
+    Args:
+        redis_client: Redis client to read from
+        keys: Snapshot keys to fetch
+
+    Returns:
+        The stored values in key order, None for keys that have expired
+    """
+    if len(keys) <= SNAPSHOT_MGET_BATCH_SIZE:
+        return redis_client.mget(keys)
+
+    pipe = redis_client.pipeline(transaction=False)
+    for start in range(0, len(keys), SNAPSHOT_MGET_BATCH_SIZE):
+        pipe.mget(keys[start : start + SNAPSHOT_MGET_BATCH_SIZE])
+    return [value for batch in pipe.execute() for value in batch]
+
+
+# Connection pools shared by every Redis client in the process (analytics,
+# data collector and notification history), keyed by the connection settings
+# so that each distinct Redis server gets a single pool.
+_CONNECTION_POOLS: Dict[tuple, redis.BlockingConnectionPool] = {}
+
+
+def get_connection_pool(**redis_kwargs) -> redis.BlockingConnectionPool:
+    """
+    Return the shared blocking connection pool for the given connection settings.
+
+    Args:
+        **redis_kwargs: Connection keyword arguments passed to the pool
+
+    Returns:
+        Shared BlockingConnectionPool instance
+    """
+    key = tuple(sorted(redis_kwargs.items()))
+    pool = _CONNECTION_POOLS.get(key)
+    if pool is None:
+        pool = redis.BlockingConnectionPool(
+            max_connections=32, timeout=5, **redis_kwargs
+        )
+        _CONNECTION_POOLS[key] = pool
+    return pool
+
+
+@atexit.register
+def _close_connection_pools():
+    """Close the connections of every shared pool when the process exits."""
+    for pool in _CONNECTION_POOLS.values():
+        pool.disconnect()
+
 
 class RedisAnalyticsService:
     """Service for retrieving and processing analytics data from Redis."""
@@ -43,6 +162,7 @@ class RedisAnalyticsService:
             "decode_responses": True,
             "socket_connect_timeout": 5,
             "socket_timeout": 5,
+            "socket_keepalive": True,
             "retry_on_timeout": True,
             "health_check_interval": 30,
         }
@@ -52,7 +172,12 @@ class RedisAnalyticsService:
         if redis_password:
             redis_kwargs["password"] = redis_password
 
-        self.redis_client = redis.Redis(**redis_kwargs)
+        self.redis_client = redis.Redis(
+            connection_pool=get_connection_pool(**redis_kwargs)
+        )
+
+        # Recently computed analytics bundle, shared by the web UI and metrics
+        self._bundle_cache = TTLCache(maxsize=1, ttl=ANALYTICS_CACHE_TTL)
 
         # Test connection
         try:
@@ -72,8 +197,9 @@ class RedisAnalyticsService:
         Returns:
             List of snapshots from the specified time period
         """
-        cutoff_timestamp = (datetime.now() - timedelta(days=days)).timestamp()
-        current_timestamp = datetime.now().timestamp()
+        now = datetime.now()
+        cutoff_timestamp = (now - timedelta(days=days)).timestamp()
+        current_timestamp = now.timestamp()
 
         # Get snapshot keys in time range
         snapshot_keys = self.redis_client.zrangebyscore(
@@ -84,14 +210,14 @@ class RedisAnalyticsService:
 
         # Batch get all snapshots
         if snapshot_keys:
-            snapshots = self.redis_client.mget(snapshot_keys)
+            snapshots = mget_snapshots(self.redis_client, snapshot_keys)
 
             for snapshot_json in snapshots:
                 if snapshot_json:
                     try:
-                        snapshot = json.loads(snapshot_json)
+                        snapshot = decode_snapshot(snapshot_json)
                         historical_data.append(snapshot)
-                    except json.JSONDecodeError:
+                    except ValueError:
                         continue
 
         # Sort by timestamp
@@ -99,17 +225,80 @@ class RedisAnalyticsService:
 
         return historical_data
 
-    def get_cluster_trends(self, days: int = 30) -> Dict[str, Any]:
+    @staticmethod
+    def _filter_days(
+        historical_data: List[Dict[str, Any]], days: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Narrow a list of snapshots down to the most recent days.
+
+        Args:
+            historical_data: Snapshots sorted by timestamp
+            days: Number of days to keep
+
+        Returns:
+            Snapshots taken within the last number of days
+        """
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        return [s for s in historical_data if s.get("timestamp", "") >= cutoff]
+
+    def get_analytics_bundle(self) -> Dict[str, Any]:
+        """
+        Get all data shown on the analytics dashboard.
+
+        The snapshots for the longest period are read from Redis once and the
+        shorter periods are sliced from them, instead of each analysis fetching
+        and decoding its own copy. The result is reused for a short while so
+        concurrent page loads and metrics refreshes don't each recompute it.
+
+        Returns:
+            Dictionary with the results of each analysis
+        """
+        bundle = self._bundle_cache.get("bundle")
+        if bundle is None:
+            bundle = self._compute_analytics_bundle()
+            self._bundle_cache.set("bundle", bundle)
+        return bundle
+
+    def _compute_analytics_bundle(self) -> Dict[str, Any]:
+        """
+        Compute all data shown on the analytics dashboard from Redis.
+
+        Returns:
+            Dictionary with the results of each analysis
+        """
+        historical_data_30d = self._get_historical_data(30)
+        historical_data_14d = self._filter_days(historical_data_30d, 14)
+        historical_data_7d = self._filter_days(historical_data_14d, 7)
+
+        return {
+            "cluster_trends_7d": self.get_cluster_trends(7, historical_data_7d),
+            "cluster_trends_30d": self.get_cluster_trends(30, historical_data_30d),
+            "deletion_activity": self.get_deletion_activity(14, historical_data_14d),
+            "compliance_stats": self.get_compliance_stats(30, historical_data_30d),
+            "namespace_activity": self.get_namespace_activity(30, historical_data_30d),
+            "owner_distribution": self.get_owner_distribution(30, historical_data_30d),
+            "expiration_analysis": self.get_expiration_analysis(
+                30, historical_data_30d
+            ),
+            "dashboard_summary": self.get_dashboard_summary(historical_data_30d),
+        }
+
+    def get_cluster_trends(
+        self, days: int = 30, historical_data: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Get cluster count trends over time.
 
         Args:
             days: Number of days to analyze
+            historical_data: Snapshots for the period, fetched from Redis if not given
 
         Returns:
             Dictionary with trend data suitable for charting
         """
-        historical_data = self._get_historical_data(days)
+        if historical_data is None:
+            historical_data = self._get_historical_data(days)
 
         if not historical_data:
             return {
@@ -189,26 +378,30 @@ class RedisAnalyticsService:
             },
         }
 
-    def get_deletion_activity(self, days: int = 14) -> Dict[str, Any]:
+    def get_deletion_activity(
+        self, days: int = 14, historical_data: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Get deletion activity patterns.
 
         Args:
             days: Number of days to analyze
+            historical_data: Snapshots for the period, fetched from Redis if not given
 
         Returns:
             Dictionary with deletion activity data
         """
-        historical_data = self._get_historical_data(days)
+        if historical_data is None:
+            historical_data = self._get_historical_data(days)
 
         deletion_reasons = Counter()
-        hourly_activity = defaultdict(int)
+        hourly_activity = [0] * 24
         daily_activity = defaultdict(int)
 
         for snapshot in historical_data:
             timestamp = datetime.fromisoformat(snapshot["timestamp"].replace("Z", ""))
             hour = timestamp.hour
-            date = timestamp.strftime("%Y-%m-%d")
+            date = snapshot["timestamp"][:10]  # Extract YYYY-MM-DD
 
             # Count deletion reasons
             if "deletion_reasons" in snapshot:
@@ -220,38 +413,39 @@ class RedisAnalyticsService:
             hourly_activity[hour] += deletion_count
             daily_activity[date] += deletion_count
 
-        # Prepare hourly distribution (0-23 hours)
-        hourly_distribution = [hourly_activity[hour] for hour in range(24)]
-
         # Get top deletion reasons
         top_reasons = dict(deletion_reasons.most_common(5))
 
         return {
             "deletion_reasons": top_reasons,
-            "hourly_distribution": hourly_distribution,
+            "hourly_distribution": hourly_activity,
             "daily_activity": dict(daily_activity),
             "summary": {
                 "total_deletion_candidates": sum(deletion_reasons.values()),
                 "most_common_reason": deletion_reasons.most_common(1)[0]
                 if deletion_reasons
                 else ("None", 0),
-                "peak_hour": max(range(24), key=lambda h: hourly_activity[h])
-                if hourly_activity
+                "peak_hour": max(range(24), key=hourly_activity.__getitem__)
+                if any(hourly_activity)
                 else 0,
             },
         }
 
-    def get_compliance_stats(self, days: int = 30) -> Dict[str, Any]:
+    def get_compliance_stats(
+        self, days: int = 30, historical_data: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Get label compliance statistics over time.
 
         Args:
             days: Number of days to analyze
+            historical_data: Snapshots for the period, fetched from Redis if not given
 
         Returns:
             Dictionary with compliance statistics
         """
-        historical_data = self._get_historical_data(days)
+        if historical_data is None:
+            historical_data = self._get_historical_data(days)
 
         if not historical_data:
             return {
@@ -292,8 +486,10 @@ class RedisAnalyticsService:
             compliance_trend.append(avg_rate)
             dates.append(date)
 
-        # Calculate label trends
+        # Calculate label trends, tracking the worst performing label as we go
         label_trends = {}
+        worst_label = "N/A"
+        worst_rate = 100
         for label_name, date_data in label_compliance_trends.items():
             label_trend = []
             for date in dates:
@@ -305,6 +501,11 @@ class RedisAnalyticsService:
                     label_trend.append(0)
             label_trends[label_name] = label_trend
 
+            current_rate = label_trend[-1] if label_trend else 0
+            if label_trend and current_rate < worst_rate:
+                worst_rate = current_rate
+                worst_label = label_name
+
         # Calculate summary statistics
         current_compliance = compliance_trend[-1] if compliance_trend else 0
         average_compliance = (
@@ -326,17 +527,6 @@ class RedisAnalyticsService:
             elif recent_avg < older_avg - 5:
                 compliance_direction = "declining"
 
-        # Find worst performing label
-        worst_label = "N/A"
-        if label_trends:
-            worst_rate = 100
-            for label_name, trend in label_trends.items():
-                if trend:
-                    current_rate = trend[-1]
-                    if current_rate < worst_rate:
-                        worst_rate = current_rate
-                        worst_label = label_name
-
         return {
             "dates": dates,
             "compliance_trend": compliance_trend,
@@ -349,17 +539,21 @@ class RedisAnalyticsService:
             },
         }
 
-    def get_namespace_activity(self, days: int = 30) -> Dict[str, Any]:
+    def get_namespace_activity(
+        self, days: int = 30, historical_data: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Get namespace activity and cluster distribution.
 
         Args:
             days: Number of days to analyze
+            historical_data: Snapshots for the period, fetched from Redis if not given
 
         Returns:
             Dictionary with namespace activity data
         """
-        historical_data = self._get_historical_data(days)
+        if historical_data is None:
+            historical_data = self._get_historical_data(days)
 
         namespace_stats = defaultdict(
             lambda: {
@@ -414,17 +608,21 @@ class RedisAnalyticsService:
             },
         }
 
-    def get_owner_distribution(self, days: int = 30) -> Dict[str, Any]:
+    def get_owner_distribution(
+        self, days: int = 30, historical_data: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Get cluster ownership distribution and trends.
 
         Args:
             days: Number of days to analyze
+            historical_data: Snapshots for the period, fetched from Redis if not given
 
         Returns:
             Dictionary with ownership data
         """
-        historical_data = self._get_historical_data(days)
+        if historical_data is None:
+            historical_data = self._get_historical_data(days)
 
         owner_stats = defaultdict(
             lambda: {
@@ -461,17 +659,21 @@ class RedisAnalyticsService:
             },
         }
 
-    def get_expiration_analysis(self, days: int = 30) -> Dict[str, Any]:
+    def get_expiration_analysis(
+        self, days: int = 30, historical_data: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Get cluster expiration pattern analysis.
 
         Args:
             days: Number of days to analyze
+            historical_data: Snapshots for the period, fetched from Redis if not given
 
         Returns:
             Dictionary with expiration analysis
         """
-        historical_data = self._get_historical_data(days)
+        if historical_data is None:
+            historical_data = self._get_historical_data(days)
 
         expiration_patterns = Counter()
         expiration_trends = defaultdict(lambda: defaultdict(int))
@@ -517,18 +719,26 @@ class RedisAnalyticsService:
             },
         }
 
-    def get_dashboard_summary(self) -> Dict[str, Any]:
+    def get_dashboard_summary(
+        self, historical_data: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Get a summary for the dashboard.
 
+        Args:
+            historical_data: Snapshots for the last 30 days, fetched from Redis if not given
+
         Returns:
             Dictionary with dashboard summary data
         """
         try:
-            # Get recent data for quick summary
-            trends_7d = self.get_cluster_trends(7)
-            trends_30d = self.get_cluster_trends(30)
-            compliance = self.get_compliance_stats(7)
+            # Get recent data for quick summary, the week is sliced from the month
+            if historical_data is None:
+                historical_data = self._get_historical_data(30)
+            historical_data_7d = self._filter_days(historical_data, 7)
+            trends_7d = self.get_cluster_trends(7, historical_data_7d)
+            trends_30d = self.get_cluster_trends(30, historical_data)
+            compliance = self.get_compliance_stats(7, historical_data_7d)
 
             return {
                 "current_status": {
@@ -568,18 +778,29 @@ class RedisAnalyticsService:
     def get_database_stats(self) -> Dict[str, Any]:
         """Get Redis statistics and health information."""
         try:
-            info = self.redis_client.info()
+            # Fetch everything in one round trip, limiting INFO to the
+            # sections that are actually reported
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.info("server")
+            pipe.info("memory")
+            pipe.info("clients")
 
             # Count snapshots
-            total_snapshots = self.redis_client.zcard("analytics:snapshots:index")
+            pipe.zcard("analytics:snapshots:index")
 
             # Get date range
-            oldest_score = self.redis_client.zrange(
-                "analytics:snapshots:index", 0, 0, withscores=True
-            )
-            newest_score = self.redis_client.zrange(
-                "analytics:snapshots:index", -1, -1, withscores=True
-            )
+            pipe.zrange("analytics:snapshots:index", 0, 0, withscores=True)
+            pipe.zrange("analytics:snapshots:index", -1, -1, withscores=True)
+
+            (
+                server_info,
+                memory_info,
+                clients_info,
+                total_snapshots,
+                oldest_score,
+                newest_score,
+            ) = pipe.execute()
+            info = {**server_info, **memory_info, **clients_info}
 
             earliest = None
             latest = None
@@ -2,13 +2,31 @@
 Redis-based data collector for NKP Cluster Cleaner analytics.
 """
 
+import re
+import orjson
 import redis
-import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from collections import defaultdict, Counter
+from .cache import TTLCache
 from .cluster_manager import ClusterManager
 from .config import ConfigManager
+from .redis_analytics_service import (
+    decode_snapshot,
+    encode_snapshot,
+    get_connection_pool,
+    mget_snapshots,
+)
+import nkp_cluster_cleaner
+
+__version__ = nkp_cluster_cleaner.__version__
+
+# Seconds a looked-up NKP version is reused across snapshots, so an upgrade
+# is still picked up by a long-running collector
+NKP_VERSION_CACHE_TTL = 3600
+
+# Matches the "~Nd" time remaining in an expiry reason
+_DAYS_REMAINING_RE = re.compile(r"~(\d+)d")
 
 
 class RedisDataCollector:
@@ -48,6 +66,7 @@ class RedisDataCollector:
             "decode_responses": True,
             "socket_connect_timeout": 5,
             "socket_timeout": 5,
+            "socket_keepalive": True,
             "retry_on_timeout": True,
             "health_check_interval": 30,
         }
@@ -57,10 +76,14 @@ class RedisDataCollector:
         if redis_password:
             redis_kwargs["password"] = redis_password
 
-        self.redis_client = redis.Redis(**redis_kwargs)
+        # Same settings as the analytics service, so both share one pool
+        self.redis_client = redis.Redis(
+            connection_pool=get_connection_pool(**redis_kwargs)
+        )
 
         self.config_manager = config_manager or ConfigManager()
         self.cluster_manager = ClusterManager(kubeconfig_path, self.config_manager)
+        self._nkp_version_cache = TTLCache(maxsize=1, ttl=NKP_VERSION_CACHE_TTL)
 
         # Test Redis connection
         self._test_connection()
@@ -118,11 +141,13 @@ class RedisDataCollector:
 
             # Store in Redis with automatic expiration
             self._debug_print("Storing snapshot in Redis...")
-            self._store_snapshot(snapshot_data, timestamp, retention_days)
+            snapshot_key = self._store_snapshot(
+                snapshot_data, timestamp, retention_days
+            )
 
             # Cleanup old data (defensive cleanup)
             self._debug_print("Cleaning up old data...")
-            cleaned_count = self._cleanup_old_data(retention_days)
+            cleaned_count = self._cleanup_old_data(retention_days, timestamp)
 
             if cleaned_count > 0:
                 self._debug_print(f"Cleaned up {cleaned_count} old snapshots")
@@ -131,9 +156,7 @@ class RedisDataCollector:
             print(f"  - Total clusters: {len(all_clusters)}")
             print(f"  - For deletion: {len(clusters_to_delete)}")
             print(f"  - Protected: {len(excluded_clusters)}")
-            print(
-                f"  - Redis key: analytics:snapshot:{timestamp.strftime('%Y-%m-%d:%H:%M:%S')}"
-            )
+            print(f"  - Redis key: {snapshot_key}")
 
             return snapshot_data
 
@@ -143,10 +166,21 @@ class RedisDataCollector:
 
     def _store_snapshot(
         self, snapshot_data: Dict[str, Any], timestamp: datetime, retention_days: int
-    ):
-        """Store snapshot in Redis with expiration."""
-        # Create unique key with timestamp
-        snapshot_key = f"analytics:snapshot:{timestamp.strftime('%Y-%m-%d:%H:%M:%S')}"
+    ) -> str:
+        """
+        Store snapshot in Redis with expiration.
+
+        Args:
+            snapshot_data: Snapshot to store
+            timestamp: Time of the snapshot
+            retention_days: Number of days to retain the snapshot
+
+        Returns:
+            Redis key of the stored snapshot
+        """
+        # Create unique keys with timestamp
+        stamp = timestamp.strftime("%Y-%m-%d:%H:%M:%S")
+        snapshot_key = f"analytics:snapshot:{stamp}"
 
         # Store with TTL (Time To Live) for automatic cleanup
         ttl_seconds = retention_days * 24 * 60 * 60  # Convert days to seconds
@@ -154,16 +188,16 @@ class RedisDataCollector:
         pipe = self.redis_client.pipeline()
 
         # Store the main snapshot
-        pipe.setex(snapshot_key, ttl_seconds, json.dumps(snapshot_data))
+        pipe.setex(snapshot_key, ttl_seconds, encode_snapshot(snapshot_data))
 
         # Store in a sorted set for easy time-based queries
         score = timestamp.timestamp()  # Unix timestamp for sorting
         pipe.zadd("analytics:snapshots:index", {snapshot_key: score})
 
         # Store summary data for quick access
-        summary_key = f"analytics:summary:{timestamp.strftime('%Y-%m-%d:%H:%M:%S')}"
+        summary_key = f"analytics:summary:{stamp}"
         summary = {
-            "timestamp": timestamp.isoformat(),
+            "timestamp": snapshot_data["timestamp"],
             "total_clusters": snapshot_data["cluster_counts"]["total"],
             "for_deletion": snapshot_data["cluster_counts"]["for_deletion"],
             "protected": snapshot_data["cluster_counts"]["protected"],
@@ -171,49 +205,49 @@ class RedisDataCollector:
                 "overall_compliance_rate", 0
             ),
         }
-        pipe.setex(summary_key, ttl_seconds, json.dumps(summary))
+        pipe.setex(summary_key, ttl_seconds, orjson.dumps(summary))
         pipe.zadd("analytics:summaries:index", {summary_key: score})
 
         # Execute all commands
         pipe.execute()
 
-    def _cleanup_old_data(self, retention_days: int) -> int:
+        return snapshot_key
+
+    def _cleanup_old_data(
+        self, retention_days: int, now: Optional[datetime] = None
+    ) -> int:
         """
         Remove analytics snapshots older than specified days.
 
         Args:
             retention_days: Number of days of data to retain
+            now: Time to measure retention from, defaults to the current time
 
         Returns:
             Number of snapshots that were cleaned up
         """
-        cutoff_timestamp = (datetime.now() - timedelta(days=retention_days)).timestamp()
+        if now is None:
+            now = datetime.now()
+        cutoff_timestamp = (now - timedelta(days=retention_days)).timestamp()
 
-        # Get old snapshot keys
-        old_snapshots = self.redis_client.zrangebyscore(
-            "analytics:snapshots:index", 0, cutoff_timestamp
-        )
-        old_summaries = self.redis_client.zrangebyscore(
-            "analytics:summaries:index", 0, cutoff_timestamp
-        )
+        # Get old snapshot and summary keys in one round trip
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.zrangebyscore("analytics:snapshots:index", 0, cutoff_timestamp)
+        pipe.zrangebyscore("analytics:summaries:index", 0, cutoff_timestamp)
+        old_snapshots, old_summaries = pipe.execute()
 
         if not old_snapshots and not old_summaries:
             return 0
 
         pipe = self.redis_client.pipeline()
 
-        # Remove old snapshots
-        for key in old_snapshots:
-            pipe.delete(key)
-
-        # Remove old summaries
-        for key in old_summaries:
-            pipe.delete(key)
-
-        # Remove from sorted sets
+        # Remove old snapshots and summaries, UNLINK frees the memory in the
+        # background instead of blocking Redis
         if old_snapshots:
+            pipe.unlink(*old_snapshots)
             pipe.zremrangebyscore("analytics:snapshots:index", 0, cutoff_timestamp)
         if old_summaries:
+            pipe.unlink(*old_summaries)
             pipe.zremrangebyscore("analytics:summaries:index", 0, cutoff_timestamp)
 
         pipe.execute()
@@ -230,8 +264,9 @@ class RedisDataCollector:
         Returns:
             List of snapshots from the specified time period
         """
-        cutoff_timestamp = (datetime.now() - timedelta(days=days)).timestamp()
-        current_timestamp = datetime.now().timestamp()
+        now = datetime.now()
+        cutoff_timestamp = (now - timedelta(days=days)).timestamp()
+        current_timestamp = now.timestamp()
 
         # Get snapshot keys in time range
         snapshot_keys = self.redis_client.zrangebyscore(
@@ -242,14 +277,14 @@ class RedisDataCollector:
 
         # Batch get all snapshots
         if snapshot_keys:
-            snapshots = self.redis_client.mget(snapshot_keys)
+            snapshots = mget_snapshots(self.redis_client, snapshot_keys)
 
             for snapshot_json in snapshots:
                 if snapshot_json:
                     try:
-                        snapshot = json.loads(snapshot_json)
+                        snapshot = decode_snapshot(snapshot_json)
                         historical_data.append(snapshot)
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         self._debug_print(f"Error parsing snapshot: {e}")
                         continue
 
@@ -261,18 +296,29 @@ class RedisDataCollector:
     def get_database_stats(self) -> Dict[str, Any]:
         """Get Redis statistics and health information."""
         try:
-            info = self.redis_client.info()
+            # Fetch everything in one round trip, limiting INFO to the
+            # sections that are actually reported
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.info("server")
+            pipe.info("memory")
+            pipe.info("clients")
 
             # Count snapshots
-            total_snapshots = self.redis_client.zcard("analytics:snapshots:index")
+            pipe.zcard("analytics:snapshots:index")
 
             # Get date range
-            oldest_score = self.redis_client.zrange(
-                "analytics:snapshots:index", 0, 0, withscores=True
-            )
-            newest_score = self.redis_client.zrange(
-                "analytics:snapshots:index", -1, -1, withscores=True
-            )
+            pipe.zrange("analytics:snapshots:index", 0, 0, withscores=True)
+            pipe.zrange("analytics:snapshots:index", -1, -1, withscores=True)
+
+            (
+                server_info,
+                memory_info,
+                clients_info,
+                total_snapshots,
+                oldest_score,
+                newest_score,
+            ) = pipe.execute()
+            info = {**server_info, **memory_info, **clients_info}
 
             earliest = None
             latest = None
@@ -298,125 +344,31 @@ class RedisDataCollector:
     def _build_snapshot_data(
         self, all_clusters, clusters_to_delete, excluded_clusters, timestamp
     ) -> Dict[str, Any]:
-        """Build the complete snapshot data structure."""
-        unique_namespaces = self._get_unique_namespaces(all_clusters)
-
-        return {
-            "timestamp": timestamp.isoformat(),
-            "collection_metadata": {
-                "tool_version": self._get_tool_version(),
-                "total_clusters_found": len(all_clusters),
-                "namespaces_scanned": len(unique_namespaces),
-                "nkp_version": self.cluster_manager.get_nkp_version(),
-            },
-            "cluster_counts": {
-                "for_deletion": len(clusters_to_delete),
-                "protected": len(excluded_clusters),
-                "total": len(all_clusters),
-            },
-            "clusters_by_namespace": self._group_by_namespace(all_clusters),
-            "clusters_by_owner": self._group_by_owner(all_clusters),
-            "clusters_by_status": self._group_by_status(all_clusters),
-            "expiration_analysis": self._analyze_expiration_patterns(all_clusters),
-            "label_compliance": self._calculate_label_compliance(all_clusters),
-            "protection_rule_effectiveness": self._analyze_protection_rules(
-                [(cluster, reason, "excluded") for cluster, reason in excluded_clusters]
-            ),
-            "cluster_age_distribution": self._calculate_age_distribution(all_clusters),
-            "deletion_reasons": self._analyze_deletion_reasons(
-                [
-                    (cluster, reason, "deletion")
-                    for cluster, reason in clusters_to_delete
-                ]
-            ),
-        }
-
-    def _get_tool_version(self) -> str:
-        """Get the current tool version."""
-        try:
-            import nkp_cluster_cleaner
-
-            return nkp_cluster_cleaner.__version__
-        except:
-            return "unknown"
-
-    def _get_unique_namespaces(self, all_clusters: List[tuple]) -> set:
-        """Get set of unique namespaces from cluster data."""
-        namespaces = set()
-        for cluster_info, reason, status in all_clusters:
-            namespace = cluster_info.get("capi_cluster_namespace")
-            if namespace:
-                namespaces.add(namespace)
-        return namespaces
-
-    def _group_by_namespace(
-        self, all_clusters: List[tuple]
-    ) -> Dict[str, Dict[str, int]]:
-        """
-        Group clusters by namespace with counts by status.
-
-        Args:
-            all_clusters: List of (cluster_info, reason, status) tuples
-
-        Returns:
-            Dictionary with namespace as key and status counts as values
         """
-        namespace_data = defaultdict(lambda: {"deletion": 0, "excluded": 0, "total": 0})
-
-        for cluster_info, reason, status in all_clusters:
-            namespace = cluster_info.get("capi_cluster_namespace", "unknown")
-            namespace_data[namespace][status] += 1
-            namespace_data[namespace]["total"] += 1
-
-        return dict(namespace_data)
+        Build the complete snapshot data structure.
 
-    def _group_by_owner(self, all_clusters: List[tuple]) -> Dict[str, Dict[str, int]]:
-        """
-        Group clusters by owner with counts by status.
+        Every breakdown is accumulated in a single pass over the clusters.
 
         Args:
             all_clusters: List of (cluster_info, reason, status) tuples
+            clusters_to_delete: List of (cluster_info, reason) tuples marked for deletion
+            excluded_clusters: List of (cluster_info, reason) tuples that are excluded
+            timestamp: Time of the snapshot
 
         Returns:
-            Dictionary with owner as key and status counts as values
+            Dictionary with the snapshot data
         """
-        owner_data = defaultdict(lambda: {"deletion": 0, "excluded": 0, "total": 0})
-
-        for cluster_info, reason, status in all_clusters:
-            labels = cluster_info.get("labels", {})
-            owner = labels.get("owner", "no-owner")
-            owner_data[owner][status] += 1
-            owner_data[owner]["total"] += 1
-
-        return dict(owner_data)
-
-    def _group_by_status(self, all_clusters: List[tuple]) -> Dict[str, int]:
-        """
-        Count clusters by their overall status.
+        total_clusters = len(all_clusters)
 
-        Args:
-            all_clusters: List of (cluster_info, reason, status) tuples
+        required_labels = [
+            label.name for label in self.config_manager.get_criteria().extra_labels
+        ]
+        required_labels.append("expires")  # Always required
 
-        Returns:
-            Dictionary with status counts
-        """
+        unique_namespaces = set()
+        namespace_data = defaultdict(lambda: {"deletion": 0, "excluded": 0, "total": 0})
+        owner_data = defaultdict(lambda: {"deletion": 0, "excluded": 0, "total": 0})
         status_counts = Counter()
-
-        for cluster_info, reason, status in all_clusters:
-            status_counts[status] += 1
-
-        return dict(status_counts)
-
-    def _analyze_expiration_patterns(self, all_clusters: List[tuple]) -> Dict[str, Any]:
-        """
-        Analyze cluster expiration patterns.
-
-        Args:
-            all_clusters: List of (cluster_info, reason, status) tuples
-
-        Returns:
-            Dictionary with expiration analysis
-        """
         expiration_buckets = {
             "expired": 0,
             "expires_soon": 0,  # < 24 hours
@@ -425,213 +377,234 @@ class RedisDataCollector:
             "expires_later": 0,  # > 30 days
             "no_expiration": 0,
         }
-
         expires_values = []
+        label_present = dict.fromkeys(required_labels, 0)
+        fully_compliant = 0
+        protection_reasons = Counter()
+        age_buckets = {
+            "0-1_days": 0,
+            "1-7_days": 0,
+            "1-4_weeks": 0,
+            "1-12_months": 0,
+            "over_1_year": 0,
+            "unknown_age": 0,
+        }
+        deletion_reasons = Counter()
 
         for cluster_info, reason, status in all_clusters:
+            # Lowercased once and shared by every reason classification
+            reason_lower = reason.lower()
+
+            # Namespace and status breakdown
+            namespace = cluster_info.get("capi_cluster_namespace")
+            if namespace:
+                unique_namespaces.add(namespace)
+            elif "capi_cluster_namespace" not in cluster_info:
+                namespace = "unknown"
+            namespace_data[namespace][status] += 1
+            namespace_data[namespace]["total"] += 1
+            status_counts[status] += 1
+
+            # Owner breakdown
             labels = cluster_info.get("labels", {})
-            expires = labels.get("expires")
+            owner = labels.get("owner", "no-owner")
+            owner_data[owner][status] += 1
+            owner_data[owner]["total"] += 1
 
-            if not expires:
+            # Expiration patterns
+            expires = labels.get("expires")
+            if expires:
+                expires_values.append(expires)
+                expiration_buckets[self._expiration_bucket(reason, reason_lower)] += 1
+            else:
                 expiration_buckets["no_expiration"] += 1
-                continue
-
-            expires_values.append(expires)
-
-            # Determine if cluster has expired based on reason
-            if "expired" in reason.lower():
-                expiration_buckets["expired"] += 1
-            elif "expires in" in reason.lower():
-                # Extract time remaining from reason
-                if "~1d" in reason or "expires in ~0d" in reason:
-                    expiration_buckets["expires_soon"] += 1
-                elif any(f"~{i}d" in reason for i in range(2, 8)):
-                    expiration_buckets["expires_this_week"] += 1
-                elif any(f"~{i}d" in reason for i in range(8, 31)):
-                    expiration_buckets["expires_this_month"] += 1
+
+            # Label compliance, counting each label once even if an extra
+            # label is also named "expires"
+            compliant = True
+            for label_name in label_present:
+                if labels.get(label_name):
+                    label_present[label_name] += 1
                 else:
-                    expiration_buckets["expires_later"] += 1
-            else:
-                expiration_buckets["expires_later"] += 1
+                    compliant = False
+            if compliant:
+                fully_compliant += 1
 
-        # Analyze expires label patterns
-        expires_patterns = Counter(expires_values)
+            # Age distribution
+            kommander_cluster = cluster_info.get("kommander_cluster", {})
+            creation_timestamp = kommander_cluster.get("metadata", {}).get(
+                "creationTimestamp"
+            )
+            age_buckets[self._age_bucket(creation_timestamp, timestamp)] += 1
+
+            # Why clusters are protected or marked for deletion
+            if status == "excluded":
+                protection_reasons[self._protection_category(reason_lower)] += 1
+            elif status == "deletion":
+                deletion_reasons[self._deletion_category(reason_lower)] += 1
+
+        if total_clusters:
+            label_compliance = {
+                "total_clusters": total_clusters,
+                "fully_compliant": fully_compliant,
+                "overall_compliance_rate": (fully_compliant / total_clusters) * 100,
+                "label_stats": {
+                    label_name: {
+                        "present": present_count,
+                        "missing": total_clusters - present_count,
+                        "compliance_rate": (present_count / total_clusters) * 100,
+                    }
+                    for label_name, present_count in label_present.items()
+                },
+                "required_labels": required_labels,
+            }
+        else:
+            label_compliance = {
+                "total_clusters": 0,
+                "compliance_rate": 0,
+                "label_stats": {},
+            }
 
         return {
-            "buckets": expiration_buckets,
-            "common_expires_values": dict(expires_patterns.most_common(10)),
-            "total_with_expires": len(expires_values),
-            "total_without_expires": expiration_buckets["no_expiration"],
+            "timestamp": timestamp.isoformat(),
+            "collection_metadata": {
+                "tool_version": __version__,
+                "total_clusters_found": total_clusters,
+                "namespaces_scanned": len(unique_namespaces),
+                "nkp_version": self._get_nkp_version(),
+            },
+            "cluster_counts": {
+                "for_deletion": len(clusters_to_delete),
+                "protected": len(excluded_clusters),
+                "total": total_clusters,
+            },
+            "clusters_by_namespace": dict(namespace_data),
+            "clusters_by_owner": dict(owner_data),
+            "clusters_by_status": dict(status_counts),
+            "expiration_analysis": {
+                "buckets": expiration_buckets,
+                "common_expires_values": dict(Counter(expires_values).most_common(10)),
+                "total_with_expires": len(expires_values),
+                "total_without_expires": expiration_buckets["no_expiration"],
+            },
+            "label_compliance": label_compliance,
+            "protection_rule_effectiveness": dict(protection_reasons),
+            "cluster_age_distribution": age_buckets,
+            "deletion_reasons": dict(deletion_reasons),
         }
 
-    def _calculate_label_compliance(self, all_clusters: List[tuple]) -> Dict[str, Any]:
+    def _get_nkp_version(self) -> Optional[str]:
+        """Get the NKP version, reusing a recent lookup."""
+        # Wrapped in a tuple so a failed lookup (None) is cached as well
+        cached = self._nkp_version_cache.get("nkp_version")
+        if cached is None:
+            cached = (self.cluster_manager.get_nkp_version(),)
+            self._nkp_version_cache.set("nkp_version", cached)
+        return cached[0]
+
+    @staticmethod
+    def _expiration_bucket(reason: str, reason_lower: str) -> str:
         """
-        Calculate label compliance statistics.
+        Classify a labelled cluster by how soon it expires.
 
         Args:
-            all_clusters: List of (cluster_info, reason, status) tuples
+            reason: Reason the cluster was marked for deletion or excluded
+            reason_lower: The same reason, lowercased
 
         Returns:
-            Dictionary with compliance statistics
+            Name of the expiration bucket
         """
-        total_clusters = len(all_clusters)
-        if total_clusters == 0:
-            return {"total_clusters": 0, "compliance_rate": 0, "label_stats": {}}
-
-        required_labels = [
-            label.name for label in self.config_manager.get_criteria().extra_labels
-        ]
-        required_labels.append("expires")  # Always required
-
-        label_stats = {}
-        for label_name in required_labels:
-            present_count = 0
-            for cluster_info, reason, status in all_clusters:
-                labels = cluster_info.get("labels", {})
-                if label_name in labels and labels[label_name]:
-                    present_count += 1
-
-            label_stats[label_name] = {
-                "present": present_count,
-                "missing": total_clusters - present_count,
-                "compliance_rate": (present_count / total_clusters) * 100,
-            }
-
-        # Overall compliance (all required labels present)
-        fully_compliant = 0
-        for cluster_info, reason, status in all_clusters:
-            labels = cluster_info.get("labels", {})
-            if all(
-                label_name in labels and labels[label_name]
-                for label_name in required_labels
-            ):
-                fully_compliant += 1
-
-        overall_compliance_rate = (fully_compliant / total_clusters) * 100
-
-        return {
-            "total_clusters": total_clusters,
-            "fully_compliant": fully_compliant,
-            "overall_compliance_rate": overall_compliance_rate,
-            "label_stats": label_stats,
-            "required_labels": required_labels,
-        }
-
-    def _analyze_protection_rules(
-        self, excluded_clusters: List[tuple]
-    ) -> Dict[str, int]:
+        # Determine if cluster has expired based on reason
+        if "expired" in reason_lower:
+            return "expired"
+        if "expires in" in reason_lower:
+            # Extract time remaining from reason
+            days = {int(d) for d in _DAYS_REMAINING_RE.findall(reason)}
+            if 1 in days or "expires in ~0d" in reason:
+                return "expires_soon"
+            if any(2 <= d < 8 for d in days):
+                return "expires_this_week"
+            if any(8 <= d < 31 for d in days):
+                return "expires_this_month"
+        return "expires_later"
+
+    @staticmethod
+    def _protection_category(reason_lower: str) -> str:
         """
-        Analyze which protection rules are most effective.
+        Categorize why a cluster is excluded from deletion.
 
         Args:
-            excluded_clusters: List of (cluster_info, reason, status) tuples for excluded clusters
+            reason_lower: Lowercased reason the cluster was excluded
 
         Returns:
-            Dictionary with protection rule usage counts
+            Protection rule category
         """
-        protection_reasons = Counter()
-
-        for cluster_info, reason, status in excluded_clusters:
-            # Categorize protection reasons
-            reason_lower = reason.lower()
-            if "management cluster" in reason_lower:
-                protection_reasons["Management Cluster"] += 1
-            elif "protected by configuration" in reason_lower:
-                protection_reasons["Protected Pattern"] += 1
-            elif "not expired yet" in reason_lower:
-                protection_reasons["Not Expired"] += 1
-            elif "referenced capi cluster" in reason_lower:
-                protection_reasons["Missing CAPI Reference"] += 1
-            elif "no valid capi cluster reference" in reason_lower:
-                protection_reasons["Invalid CAPI Reference"] += 1
-            else:
-                protection_reasons["Other"] += 1
-
-        return dict(protection_reasons)
-
-    def _calculate_age_distribution(self, all_clusters: List[tuple]) -> Dict[str, int]:
+        if "management cluster" in reason_lower:
+            return "Management Cluster"
+        if "protected by configuration" in reason_lower:
+            return "Protected Pattern"
+        if "not expired yet" in reason_lower:
+            return "Not Expired"
+        if "referenced capi cluster" in reason_lower:
+            return "Missing CAPI Reference"
+        if "no valid capi cluster reference" in reason_lower:
+            return "Invalid CAPI Reference"
+        return "Other"
+
+    @staticmethod
+    def _age_bucket(creation_timestamp: Optional[str], now: datetime) -> str:
         """
-        Calculate cluster age distribution based on creation timestamps.
+        Classify a cluster by the age given by its creation timestamp.
 
         Args:
-            all_clusters: List of (cluster_info, reason, status) tuples
+            creation_timestamp: Creation timestamp of the KommanderCluster
+            now: Current time
 
         Returns:
-            Dictionary with age bucket counts
+            Name of the age bucket
         """
-        age_buckets = {
-            "0-1_days": 0,
-            "1-7_days": 0,
-            "1-4_weeks": 0,
-            "1-12_months": 0,
-            "over_1_year": 0,
-            "unknown_age": 0,
-        }
-
-        now = datetime.now()
-
-        for cluster_info, reason, status in all_clusters:
-            kommander_cluster = cluster_info.get("kommander_cluster", {})
-            metadata = kommander_cluster.get("metadata", {})
-            creation_timestamp = metadata.get("creationTimestamp")
-
-            if not creation_timestamp:
-                age_buckets["unknown_age"] += 1
-                continue
-
-            try:
-                # Parse creation timestamp
-                if creation_timestamp.endswith("Z"):
-                    creation_time = datetime.fromisoformat(creation_timestamp[:-1])
-                else:
-                    creation_time = datetime.fromisoformat(creation_timestamp)
-
-                age = now - creation_time
-                age_days = age.days
-
-                if age_days <= 1:
-                    age_buckets["0-1_days"] += 1
-                elif age_days <= 7:
-                    age_buckets["1-7_days"] += 1
-                elif age_days <= 28:
-                    age_buckets["1-4_weeks"] += 1
-                elif age_days <= 365:
-                    age_buckets["1-12_months"] += 1
-                else:
-                    age_buckets["over_1_year"] += 1
-
-            except (ValueError, TypeError):
-                age_buckets["unknown_age"] += 1
+        if not creation_timestamp:
+            return "unknown_age"
 
-        return age_buckets
-
-    def _analyze_deletion_reasons(
-        self, clusters_to_delete: List[tuple]
-    ) -> Dict[str, int]:
+        try:
+            # Parse creation timestamp
+            if creation_timestamp.endswith("Z"):
+                creation_time = datetime.fromisoformat(creation_timestamp[:-1])
+            else:
+                creation_time = datetime.fromisoformat(creation_timestamp)
+            age_days = (now - creation_time).days
+        except (ValueError, TypeError):
+            return "unknown_age"
+
+        if age_days <= 1:
+            return "0-1_days"
+        if age_days <= 7:
+            return "1-7_days"
+        if age_days <= 28:
+            return "1-4_weeks"
+        if age_days <= 365:
+            return "1-12_months"
+        return "over_1_year"
+
+    @staticmethod
+    def _deletion_category(reason_lower: str) -> str:
         """
-        Analyze the reasons why clusters are marked for deletion.
+        Categorize why a cluster is marked for deletion.
 
         Args:
-            clusters_to_delete: List of (cluster_info, reason, status) tuples
+            reason_lower: Lowercased reason the cluster was marked for deletion
 
         Returns:
-            Dictionary with deletion reason counts
+            Deletion reason category
         """
-        deletion_reasons = Counter()
-
-        for cluster_info, reason, status in clusters_to_delete:
-            reason_lower = reason.lower()
-            if "missing" in reason_lower and "expires" in reason_lower:
-                deletion_reasons["Missing Expires Label"] += 1
-            elif "missing" in reason_lower and "label" in reason_lower:
-                deletion_reasons["Missing Required Label"] += 1
-            elif "expired" in reason_lower:
-                deletion_reasons["Cluster Expired"] += 1
-            elif "invalid" in reason_lower and "expires" in reason_lower:
-                deletion_reasons["Invalid Expires Format"] += 1
-            elif "does not match pattern" in reason_lower:
-                deletion_reasons["Label Pattern Mismatch"] += 1
-            else:
-                deletion_reasons["Other"] += 1
-
-        return dict(deletion_reasons)
+        if "missing" in reason_lower and "expires" in reason_lower:
+            return "Missing Expires Label"
+        if "missing" in reason_lower and "label" in reason_lower:
+            return "Missing Required Label"
+        if "expired" in reason_lower:
+            return "Cluster Expired"
+        if "invalid" in reason_lower and "expires" in reason_lower:
+            return "Invalid Expires Format"
+        if "does not match pattern" in reason_lower:
+            return "Label Pattern Mismatch"
+        return "Other"
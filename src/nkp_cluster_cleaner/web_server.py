@@ -2,10 +2,28 @@
 Web server module for the NKP Cluster Cleaner web UI.
 """
 
+import copy
+import gzip
+import hashlib
 import os
+import orjson
+import sys
+import threading
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request
-from typing import Optional
+from functools import lru_cache
+from jinja2 import FileSystemBytecodeCache
+from flask.json.provider import DefaultJSONProvider
+from flask import (
+    Blueprint,
+    Flask,
+    Response,
+    render_template,
+    jsonify,
+    request,
+    make_response,
+)
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from .cache import TTLCache
 from .config import ConfigManager
 from .cluster_manager import ClusterManager
 from .cronjob_manager import CronJobManager
@@ -15,6 +33,279 @@ import nkp_cluster_cleaner
 
 __version__ = nkp_cluster_cleaner.__version__
 
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Production server settings used when not running in debug mode
+GUNICORN_WORKERS = 4
+GUNICORN_THREADS = 8
+GUNICORN_TIMEOUT = 60
+
+# How long cluster listings are reused before querying Kubernetes again
+CLUSTER_CACHE_TTL = 15
+
+# How long the scheduled tasks summary is reused
+SCHEDULED_TASKS_CACHE_TTL = 5
+
+# How long health probe results are reused
+HEALTH_CACHE_TTL = 5
+
+# How long the NKP version shown on the index page is reused
+NKP_VERSION_CACHE_TTL = 10
+
+# Responses smaller than this are not worth compressing
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 5
+GZIP_MIMETYPES = frozenset(
+    ["text/html", "text/plain", "text/css", "application/json", "text/javascript"]
+)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib encoder."""
+
+    def dumps_bytes(self, obj: Any, **kwargs: Any) -> bytes:
+        """
+        Serialize data as UTF-8 encoded JSON.
+
+        Datetimes are written as ISO 8601 to the second, so views can pass
+        datetime objects straight through.
+
+        Args:
+            obj: The data to serialize
+            kwargs: Options passed by Flask, only sort_keys and indent are used
+
+        Returns:
+            JSON bytes
+        """
+        option = orjson.OPT_OMIT_MICROSECONDS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON.
+
+        Args:
+            obj: The data to serialize
+            kwargs: Options passed by Flask, only sort_keys and indent are used
+
+        Returns:
+            JSON string
+        """
+        return self.dumps_bytes(obj, **kwargs).decode()
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the arguments as JSON and return a response with it.
+
+        Used by jsonify(). The body is handed to the response as the bytes
+        orjson produces, instead of being decoded to a string and encoded
+        again.
+
+        Returns:
+            Response with the JSON body
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self.dumps_bytes(obj, indent=indent) + b"\n", mimetype=self.mimetype
+        )
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """
+        Deserialize data as JSON.
+
+        Args:
+            s: Text or UTF-8 bytes
+
+        Returns:
+            The deserialized data
+        """
+        return orjson.loads(s)
+
+
+def _normalize_prefix(url_prefix: Optional[str]) -> str:
+    """
+    Normalize a URL prefix to the form used for routes.
+
+    Args:
+        url_prefix: Prefix as given by the user, e.g. 'foo', '/foo/' or None
+
+    Returns:
+        Prefix with a single leading slash and no trailing slash (e.g. '/foo'),
+        or an empty string for no prefix
+    """
+    url_prefix = (url_prefix or "").strip("/")
+    return "/" + url_prefix if url_prefix else ""
+
+
+def _now_str() -> str:
+    """
+    Format the current local time for display in the UI.
+
+    Returns:
+        Current time as "YYYY-MM-DD HH:MM:SS"
+    """
+    n = datetime.now()
+    return (
+        f"{n.year:04}-{n.month:02}-{n.day:02} {n.hour:02}:{n.minute:02}:{n.second:02}"
+    )
+
+
+def iter_cluster_data(cluster_list: List[Tuple[Dict, str]]) -> Iterator[Dict]:
+    """
+    Lazily convert (cluster_info, reason) tuples into JSON-friendly dictionaries.
+
+    Args:
+        cluster_list: List of (cluster_info, reason) tuples from ClusterManager
+
+    Returns:
+        Iterator of dictionaries with the cluster name, namespace, labels and reason
+    """
+    return (
+        {
+            "capi_cluster_name": cluster_info.get("capi_cluster_name"),
+            "capi_cluster_namespace": cluster_info.get("capi_cluster_namespace"),
+            "labels": cluster_info.get("labels") or {},
+            "reason": reason,
+        }
+        for cluster_info, reason in cluster_list
+    )
+
+
+def serialize_cluster_data(cluster_list: List[Tuple[Dict, str]]) -> List[Dict]:
+    """
+    Convert (cluster_info, reason) tuples into JSON-friendly dictionaries.
+
+    Args:
+        cluster_list: List of (cluster_info, reason) tuples from ClusterManager
+
+    Returns:
+        List of dictionaries with the cluster name, namespace, labels and reason
+    """
+    return list(iter_cluster_data(cluster_list))
+
+
+def _iter_json_array(records: Iterable[Dict]) -> Iterator[bytes]:
+    """
+    Encode records as the comma-separated body of a JSON array.
+
+    Args:
+        records: Records to encode
+
+    Returns:
+        Iterator of encoded chunks
+    """
+    separator = b""
+    for record in records:
+        yield separator + orjson.dumps(record)
+        separator = b","
+
+
+def _stream_clusters_json(
+    clusters_to_delete: List[Tuple[Dict, str]],
+    excluded_clusters: List[Tuple[Dict, str]],
+    namespace_filter: Optional[str],
+    fetched_at: datetime,
+) -> Iterator[bytes]:
+    """
+    Encode the /api/clusters response body one cluster at a time.
+
+    Produces the same document as the buffered response without holding the
+    whole encoded body in memory.
+
+    Args:
+        clusters_to_delete: List of (cluster_info, reason) tuples for deletion
+        excluded_clusters: List of (cluster_info, reason) tuples for excluded clusters
+        namespace_filter: Namespace the listing was filtered to, if any
+        fetched_at: When the listing was fetched from Kubernetes
+
+    Returns:
+        Iterator of encoded chunks
+    """
+    yield b'{"success":true,"clusters_to_delete":['
+    yield from _iter_json_array(iter_cluster_data(clusters_to_delete))
+    yield b'],"excluded_clusters":['
+    yield from _iter_json_array(iter_cluster_data(excluded_clusters))
+    yield b'],"namespace_filter":' + orjson.dumps(namespace_filter)
+    yield b',"timestamp":' + orjson.dumps(
+        fetched_at, option=orjson.OPT_OMIT_MICROSECONDS
+    )
+    yield b"}"
+
+
+# Placeholder data each page renders with when loading its data fails
+ERROR_CONTEXTS: Dict[str, Dict[str, Any]] = {
+    "notifications.html": {"critical_count": 0, "warning_count": 0, "total_count": 0},
+    "rules.html": {
+        "rule_count": 4,
+        "protected_cluster_count": 0,
+        "excluded_namespace_count": 0,
+        "extra_labels_count": 0,
+        "time_format_count": 4,
+        "protected_cluster_patterns": [],
+        "excluded_namespace_patterns": [],
+        "extra_labels": [],
+    },
+    "scheduled_tasks.html": {
+        "summary": {
+            "total_cronjobs": 0,
+            "active_cronjobs": 0,
+            "suspended_cronjobs": 0,
+            "total_recent_jobs": 0,
+            "successful_jobs": 0,
+            "failed_jobs": 0,
+            "running_jobs": 0,
+            "cronjobs": [],
+            "recent_jobs": [],
+        },
+    },
+}
+
+
+def gzip_response(response: Response) -> Response:
+    """
+    Compress a response with gzip if the client accepts it.
+
+    Streamed responses, small bodies and non-text content are left alone.
+
+    Args:
+        response: Response produced by a view
+
+    Returns:
+        The response, compressed where worthwhile
+    """
+    if (
+        response.status_code not in (200, 304)
+        or response.direct_passthrough
+        or response.is_streamed
+        or response.mimetype not in GZIP_MIMETYPES
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    # A 304 must carry the same Vary as the 200 it revalidates
+    response.vary.add("Accept-Encoding")
+    if response.status_code != 200 or not request.accept_encodings["gzip"]:
+        return response
+
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0))
+    response.headers["Content-Encoding"] = "gzip"
+
+    # The compressed body is a different representation of the same resource
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+    return response
+
 
 def create_app(
     kubeconfig_path: Optional[str] = None,
@@ -27,6 +318,7 @@ def create_app(
     redis_username: Optional[str] = None,
     redis_password: Optional[str] = None,
     no_redis: bool = False,
+    debug: bool = False,
 ) -> Flask:
     """
     Create and configure the Flask application.
@@ -42,14 +334,24 @@ def create_app(
         redis_username: Redis username for authentication
         redis_password: Redis password for authentication
         no_redis: Disable analytics and Redis connections
+        debug: Enable debug mode, which reloads templates when they change
 
     Returns:
         Flask application instance
     """
-    # Get the directory where this file is located
-    template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
-
-    app = Flask(__name__, template_folder=template_dir)
+    app = Flask(__name__, template_folder=_TEMPLATE_DIR)
+    app.json = ORJSONProvider(app)
+
+    # Templates only change between releases outside of debug mode, so skip the
+    # per-render freshness checks, never evict compiled templates and keep them
+    # across restarts. These must be set before the Jinja environment is created.
+    if not debug:
+        app.jinja_options = {
+            **app.jinja_options,
+            "auto_reload": False,
+            "cache_size": -1,
+            "bytecode_cache": FileSystemBytecodeCache(),
+        }
 
     # Store configuration in app context
     app.config["KUBECONFIG_PATH"] = kubeconfig_path
@@ -62,336 +364,487 @@ def create_app(
     app.config["REDIS_PASSWORD"] = redis_password
     app.config["NO_REDIS"] = no_redis
 
-    # Normalize URL prefix
-    if url_prefix:
-        url_prefix = url_prefix.strip("/")
-        if url_prefix:
-            url_prefix = "/" + url_prefix
-        else:
-            url_prefix = ""
-    else:
-        url_prefix = ""
+    # Configuration status shown in the UI, fixed for the life of the process
+    app.config["KUBECONFIG_STATUS"] = (
+        kubeconfig_path or "Using default (~/.kube/config)"
+    )
+    app.config["CONFIG_STATUS"] = config_path or "Using default (no protection rules)"
+    app.config["KUBECONFIG_NAME"] = kubeconfig_path or "default"
+    app.config["CONFIG_NAME"] = config_path or "none"
 
+    url_prefix = _normalize_prefix(url_prefix)
     app.config["URL_PREFIX"] = url_prefix
 
-    # Create a template function for building URLs with prefix
-    @app.template_global()
-    def url_with_prefix(path):
-        """Build URL with prefix."""
-        if not path.startswith("/"):
-            path = "/" + path
-        return url_prefix + path
+    # All routes live on one blueprint mounted under the prefix
+    bp = Blueprint("main", __name__, url_prefix=url_prefix or None)
+
+    # Values every page shows, so views don't have to pass them
+    app.jinja_env.globals.update(no_redis=no_redis, version=__version__)
+
+    @app.context_processor
+    def inject_refresh_time():
+        """Provide the time of the current render to every template."""
+        return {"refresh_time": _now_str()}
+
+    # Compile every template up front so the first requests don't pay for it
+    if not debug:
+        for template_name in app.jinja_env.list_templates(extensions=["html"]):
+            app.jinja_env.get_template(template_name)
+
+    # Guards construction of the shared managers and services below
+    extensions_lock = threading.Lock()
+
+    # Short-lived cache of cluster listings, keyed by namespace filter
+    cluster_cache = TTLCache(maxsize=64, ttl=CLUSTER_CACHE_TTL)
+    cluster_lock = threading.Lock()
+
+    # Recent scheduled tasks summaries, keyed by namespace
+    tasks_cache = TTLCache(maxsize=4, ttl=SCHEDULED_TASKS_CACHE_TTL)
+    tasks_lock = threading.Lock()
+
+    # Encoded /api/clusters bodies and their ETags, keyed by namespace filter
+    # and the time the listing was fetched
+    api_clusters_cache = TTLCache(maxsize=64, ttl=CLUSTER_CACHE_TTL)
+
+    # Most recent health probe result and NKP version
+    probe_cache = TTLCache(maxsize=4, ttl=HEALTH_CACHE_TTL)
+    health_lock = threading.Lock()
 
     #
     # Helpers
     #
+    def get_config_mtime():
+        """Helper to get the modification time of the config file, if any."""
+        config_path = app.config["CONFIG_PATH"]
+        return os.path.getmtime(config_path) if config_path else None
+
+    def get_shared(name, factory):
+        """
+        Helper to lazily build a shared object and keep it on app.extensions.
+
+        Construction is serialized by a lock so concurrent first requests
+        don't each build their own copy. Later lookups don't take the lock.
+        """
+        instance = app.extensions.get(name)
+        if instance is None:
+            with extensions_lock:
+                instance = app.extensions.get(name)
+                if instance is None:
+                    instance = factory()
+                    app.extensions[name] = instance
+        return instance
+
     def get_cluster_manager():
-        """Helper to create cluster manager with current config."""
-        config_manager = (
-            ConfigManager(app.config["CONFIG_PATH"])
-            if app.config["CONFIG_PATH"]
-            else ConfigManager()
-        )
-        return ClusterManager(
-            app.config["KUBECONFIG_PATH"],
-            config_manager,
-            grace_period=app.config["GRACE_PERIOD"],
-        )
+        """
+        Helper to get the cluster manager with current config.
+
+        The manager is built once and reused. When the configuration file
+        changes on disk it is replaced by a copy using the new rules, which
+        shares the existing Kubernetes clients.
+        """
+        config_path = app.config["CONFIG_PATH"]
+        config_mtime = get_config_mtime()
+
+        cached = app.extensions.get("cluster_manager")
+        if cached and cached[0] == config_mtime:
+            return cached[1]
+
+        with extensions_lock:
+            cached = app.extensions.get("cluster_manager")
+            if cached and cached[0] == config_mtime:
+                return cached[1]
+
+            config_manager = (
+                ConfigManager(config_path) if config_path else ConfigManager()
+            )
+            if cached:
+                # Only the rules changed, there's no need to reload kubeconfig
+                cluster_manager = copy.copy(cached[1])
+                cluster_manager.config_manager = config_manager
+            else:
+                cluster_manager = ClusterManager(
+                    app.config["KUBECONFIG_PATH"],
+                    config_manager,
+                    grace_period=app.config["GRACE_PERIOD"],
+                )
+            app.extensions["cluster_manager"] = (config_mtime, cluster_manager)
+            return cluster_manager
 
     def get_cronjob_manager():
-        """Helper to create cronjob manager with current config."""
-        return CronJobManager(app.config["KUBECONFIG_PATH"])
+        """Helper to get the shared cronjob manager."""
+        return get_shared(
+            "cronjob_manager",
+            lambda: CronJobManager(app.config["KUBECONFIG_PATH"]),
+        )
 
     def get_analytics_service():
-        """Helper to create analytics service with current config."""
-        return RedisAnalyticsService(
-            kubeconfig_path=app.config["KUBECONFIG_PATH"],
-            redis_host=app.config["REDIS_HOST"],
-            redis_port=app.config["REDIS_PORT"],
-            redis_db=app.config["REDIS_DB"],
-            redis_username=app.config["REDIS_USERNAME"],
-            redis_password=app.config["REDIS_PASSWORD"],
+        """Helper to get the shared analytics service."""
+        return get_shared(
+            "analytics_service",
+            lambda: RedisAnalyticsService(
+                kubeconfig_path=app.config["KUBECONFIG_PATH"],
+                redis_host=app.config["REDIS_HOST"],
+                redis_port=app.config["REDIS_PORT"],
+                redis_db=app.config["REDIS_DB"],
+                redis_username=app.config["REDIS_USERNAME"],
+                redis_password=app.config["REDIS_PASSWORD"],
+            ),
         )
 
-    #
-    # Routes
-    #
-    @app.route(url_prefix + "/")
-    def index():
-        """Main page showing cluster information."""
-        # Determine configuration status
-        kubeconfig_status = (
-            app.config["KUBECONFIG_PATH"] or "Using default (~/.kube/config)"
+    def get_notification_history():
+        """Helper to get the shared notification history store."""
+        from .notification_history import NotificationHistory
+
+        return get_shared(
+            "notification_history",
+            lambda: NotificationHistory(
+                app.config["REDIS_HOST"],
+                app.config["REDIS_PORT"],
+                app.config["REDIS_DB"],
+                app.config["REDIS_USERNAME"],
+                app.config["REDIS_PASSWORD"],
+            ),
         )
-        config_status = (
-            app.config["CONFIG_PATH"] or "Using default (no protection rules)"
+
+    def get_metrics_service():
+        """Helper to get the shared Prometheus metrics service."""
+        if app.config["NO_REDIS"]:
+            # Metrics service without analytics
+            return get_shared("metrics_service", PrometheusMetricsService)
+        # Resolved first, get_shared() must not be re-entered from a factory
+        analytics_service = get_analytics_service()
+        return get_shared(
+            "metrics_service",
+            lambda: PrometheusMetricsService(analytics_service),
         )
+
+    def get_clusters_with_exclusions(namespace_filter=None):
+        """
+        Helper to get clusters with exclusions, reusing recent results.
+
+        When the cached listing expires, concurrent requests (e.g. several
+        open dashboards) wait for a single refresh instead of each listing
+        the clusters themselves.
+
+        Returns:
+            Tuple of (clusters_to_delete, excluded_clusters, fetched_at)
+        """
+        key = (namespace_filter,)
+        result = cluster_cache.get(key)
+        if result is None:
+            with cluster_lock:
+                result = cluster_cache.get(key)
+                if result is None:
+                    cluster_manager = get_cluster_manager()
+                    clusters_to_delete, excluded_clusters = (
+                        cluster_manager.get_clusters_with_exclusions(namespace_filter)
+                    )
+                    result = (clusters_to_delete, excluded_clusters, datetime.now())
+                    cluster_cache.set(key, result)
+        return result
+
+    def get_scheduled_tasks_summary(namespace):
+        """
+        Helper to get the scheduled tasks summary, reusing a recent one.
+
+        Concurrent requests wait for a single refresh instead of each
+        listing the CronJobs and Jobs themselves.
+        """
+        summary = tasks_cache.get(namespace)
+        if summary is None:
+            with tasks_lock:
+                summary = tasks_cache.get(namespace)
+                if summary is None:
+                    cronjob_manager = get_cronjob_manager()
+                    summary = cronjob_manager.get_all_scheduled_tasks_summary(namespace)
+                    tasks_cache.set(namespace, summary)
+        return summary
+
+    def get_nkp_version():
+        """Helper to get the NKP version, reusing a recent lookup."""
+        # Wrapped in a tuple so a failed lookup (None) is cached as well
+        cached = probe_cache.get("nkp_version")
+        if cached is None:
+            cached = (get_cluster_manager().get_nkp_version(),)
+            probe_cache.set("nkp_version", cached, ttl=NKP_VERSION_CACHE_TTL)
+        return cached[0]
+
+    def check_health():
+        """Helper to probe Kubernetes and Redis connectivity."""
+        # Try to create cluster manager to test connectivity
         cluster_manager = get_cluster_manager()
-        nkp_version = cluster_manager.get_nkp_version()
+        # Simple connectivity test
+        cluster_manager.check_kommander_crds()
+
+        health_data = {
+            "status": "ok",
+            "service": "nkp-cluster-cleaner",
+            "version": __version__,
+            "kubeconfig": app.config["KUBECONFIG_NAME"],
+            "config": app.config["CONFIG_NAME"],
+        }
+
+        if not app.config["NO_REDIS"]:
+            health_data["redis"] = (
+                f"{app.config['REDIS_HOST']}:{app.config['REDIS_PORT']}"
+            )
+            # Test Redis connection
+            analytics_service = get_analytics_service()
+            redis_stats = analytics_service.get_database_stats()
+
+            if "error" not in redis_stats:
+                health_data["redis_status"] = "connected"
+                health_data["redis_snapshots"] = redis_stats.get("total_snapshots", 0)
+            else:
+                health_data["redis_status"] = "error"
+                health_data["redis_error"] = redis_stats["error"]
+
+        return health_data
 
+    def render_error(template_name, error, **context):
+        """
+        Helper to render a page in its error state.
+
+        The page gets the placeholder data from ERROR_CONTEXTS, so it renders
+        without any of the data that failed to load.
+        """
         return render_template(
-            "index.html",
-            no_redis=app.config["NO_REDIS"],
-            kubeconfig_status=kubeconfig_status,
-            config_status=config_status,
-            grace_period=app.config["GRACE_PERIOD"],
-            version=__version__,
-            nkp_version=nkp_version,
+            template_name,
+            **{**ERROR_CONTEXTS.get(template_name, {}), **context},
+            error=str(error),
         )
 
-    @app.route(url_prefix + "/health")
-    def health():
-        """Health check endpoint."""
-        try:
-            # Try to create cluster manager to test connectivity
-            cluster_manager = get_cluster_manager()
-            # Simple connectivity test
-            cluster_manager.check_kommander_crds()
+    def probe_health():
+        """
+        Helper to run the health check and encode its response body.
 
+        Returns:
+            Tuple of (JSON body, HTTP status code)
+        """
+        try:
+            health_data = check_health()
+        except Exception as e:
             health_data = {
-                "status": "ok",
+                "status": "error",
                 "service": "nkp-cluster-cleaner",
                 "version": __version__,
-                "kubeconfig": app.config["KUBECONFIG_PATH"] or "default",
-                "config": app.config["CONFIG_PATH"] or "none",
-                "timestamp": datetime.now().isoformat(),
+                "error": str(e),
             }
 
-            if not app.config["NO_REDIS"]:
-                health_data["redis"] = (
-                    f"{app.config['REDIS_HOST']}:{app.config['REDIS_PORT']}"
-                )
-                # Test Redis connection
-                analytics_service = get_analytics_service()
-                redis_stats = analytics_service.get_database_stats()
-
-                if "error" not in redis_stats:
-                    health_data["redis_status"] = "connected"
-                    health_data["redis_snapshots"] = redis_stats.get(
-                        "total_snapshots", 0
-                    )
-                else:
-                    health_data["redis_status"] = "error"
-                    health_data["redis_error"] = redis_stats["error"]
+        health_data["timestamp"] = datetime.now()
+        status_code = 200 if health_data["status"] == "ok" else 500
+        return app.json.dumps_bytes(health_data) + b"\n", status_code
 
-            return jsonify(health_data)
+    #
+    # Routes
+    #
+    @bp.route("/")
+    def index():
+        """Main page showing cluster information."""
+        nkp_version = get_nkp_version()
 
-        except Exception as e:
-            return jsonify(
-                {
-                    "status": "error",
-                    "service": "nkp-cluster-cleaner",
-                    "version": __version__,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                }
-            ), 500
+        return render_template(
+            "index.html",
+            kubeconfig_status=app.config["KUBECONFIG_STATUS"],
+            config_status=app.config["CONFIG_STATUS"],
+            grace_period=app.config["GRACE_PERIOD"],
+            nkp_version=nkp_version,
+        )
 
-    @app.route(url_prefix + "/clusters")
+    @bp.route("/health")
+    def health():
+        """Health check endpoint."""
+        # Probe results are reused for a few seconds, already encoded, so
+        # frequent liveness checks neither reach the API server and Redis nor
+        # serialize JSON. Concurrent misses wait for a single probe.
+        cached = probe_cache.get("health")
+        if cached is None:
+            with health_lock:
+                cached = probe_cache.get("health")
+                if cached is None:
+                    cached = probe_health()
+                    probe_cache.set("health", cached)
+
+        body, status_code = cached
+        return Response(body, status_code, mimetype="application/json")
+
+    @bp.route("/clusters")
     def clusters():
         """Display clusters that match deletion criteria."""
-        namespace_filter = request.args.get("namespace")
-
-        try:
-            # Get cluster manager
-            cluster_manager = get_cluster_manager()
+        # The cluster tables are rendered in the browser from /api/clusters
+        return render_template(
+            "clusters.html",
+            kubeconfig_status=app.config["KUBECONFIG_NAME"],
+            config_status=app.config["CONFIG_NAME"],
+            namespace_filter=request.args.get("namespace"),
+            grace_period=app.config["GRACE_PERIOD"],
+        )
 
-            # Get clusters with exclusions
-            clusters_to_delete, excluded_clusters = (
-                cluster_manager.get_clusters_with_exclusions(namespace_filter)
-            )
+    @bp.route("/api/clusters")
+    def api_clusters():
+        """
+        API endpoint returning clusters that match deletion criteria as JSON.
 
-            # Determine configuration status
-            kubeconfig_status = app.config["KUBECONFIG_PATH"] or "default"
-            config_status = app.config["CONFIG_PATH"] or "none"
+        Pass stream=1 to have very large listings encoded and sent one cluster
+        at a time instead of as a single buffered body.
+        """
+        namespace_filter = request.args.get("namespace")
+        stream = request.args.get("stream") == "1"
 
-            return render_template(
-                "clusters.html",
-                no_redis=app.config["NO_REDIS"],
-                clusters_to_delete=clusters_to_delete,
-                excluded_clusters=excluded_clusters,
-                kubeconfig_status=kubeconfig_status,
-                config_status=config_status,
-                namespace_filter=namespace_filter,
-                grace_period=app.config["GRACE_PERIOD"],
-                version=__version__,
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                error=None,
+        try:
+            clusters_to_delete, excluded_clusters, fetched_at = (
+                get_clusters_with_exclusions(namespace_filter)
             )
+            if stream:
+                return Response(
+                    _stream_clusters_json(
+                        clusters_to_delete,
+                        excluded_clusters,
+                        namespace_filter,
+                        fetched_at,
+                    ),
+                    mimetype="application/json",
+                )
+            # Polls between listing refreshes get the same bytes, so they are
+            # only encoded and hashed once per listing
+            key = (namespace_filter, fetched_at)
+            cached = api_clusters_cache.get(key)
+            if cached is None:
+                body = {
+                    "success": True,
+                    "clusters_to_delete": serialize_cluster_data(clusters_to_delete),
+                    "excluded_clusters": serialize_cluster_data(excluded_clusters),
+                    "namespace_filter": namespace_filter,
+                    "timestamp": fetched_at,
+                }
+                data = orjson.dumps(body, option=orjson.OPT_OMIT_MICROSECONDS)
+                cached = (data, hashlib.blake2b(data, digest_size=8).hexdigest())
+                api_clusters_cache.set(key, cached)
+
+            data, etag = cached
+            response = Response(data, mimetype="application/json")
+            # The body only changes when the cached listing is refreshed
+            response.headers["Cache-Control"] = "private, max-age=10"
+            response.set_etag(etag)
+            return response.make_conditional(request)
         except Exception as e:
-            # Render error state
-            return render_template(
-                "clusters.html",
-                no_redis=app.config["NO_REDIS"],
-                clusters_to_delete=[],
-                excluded_clusters=[],
-                kubeconfig_status=app.config["KUBECONFIG_PATH"] or "default",
-                config_status=app.config["CONFIG_PATH"] or "none",
-                namespace_filter=namespace_filter,
-                grace_period=app.config["GRACE_PERIOD"],
-                version=__version__,
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                error=str(e),
-            )
+            body = {
+                "success": False,
+                "error": str(e),
+                "timestamp": datetime.now(),
+            }
+            data = orjson.dumps(body, option=orjson.OPT_OMIT_MICROSECONDS)
+            return Response(data, status=500, mimetype="application/json")
 
-    @app.route(url_prefix + "/analytics")
+    @bp.route("/analytics")
     def analytics():
         """Analytics dashboard page."""
 
         if app.config["NO_REDIS"]:
-            return render_template(
-                "analytics.html",
-                no_redis=app.config["NO_REDIS"],
-                error="Analytics features have been disabled.",
-                version=__version__,
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            return render_error(
+                "analytics.html", "Analytics features have been disabled."
             )
 
         try:
             analytics_service = get_analytics_service()
 
             # Get analytics data for different time periods
-            cluster_trends_7d = analytics_service.get_cluster_trends(7)
-            cluster_trends_30d = analytics_service.get_cluster_trends(30)
-            deletion_activity = analytics_service.get_deletion_activity(14)
-            compliance_stats = analytics_service.get_compliance_stats(30)
-            namespace_activity = analytics_service.get_namespace_activity(30)
-            owner_distribution = analytics_service.get_owner_distribution(30)
-            expiration_analysis = analytics_service.get_expiration_analysis(30)
-            dashboard_summary = analytics_service.get_dashboard_summary()
+            analytics_data = analytics_service.get_analytics_bundle()
 
             return render_template(
                 "analytics.html",
-                no_redis=app.config["NO_REDIS"],
-                cluster_trends_7d=cluster_trends_7d,
-                cluster_trends_30d=cluster_trends_30d,
-                deletion_activity=deletion_activity,
-                compliance_stats=compliance_stats,
-                namespace_activity=namespace_activity,
-                owner_distribution=owner_distribution,
-                expiration_analysis=expiration_analysis,
-                dashboard_summary=dashboard_summary,
-                version=__version__,
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                **analytics_data,
                 error=None,
             )
         except Exception as e:
-            return render_template(
-                "analytics.html",
-                no_redis=app.config["NO_REDIS"],
-                error=str(e),
-                version=__version__,
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            )
+            return render_error("analytics.html", e)
+
+    @lru_cache(maxsize=8)
+    def render_rules(config_mtime):
+        """
+        Render the rules page, cached until the config file changes.
+
+        Returns:
+            Tuple of (html, etag)
+        """
+        # Get cluster manager to access configuration
+        cluster_manager = get_cluster_manager()
+        config_manager = cluster_manager.config_manager
+        criteria = config_manager.get_criteria()
+
+        # Count various configuration elements
+        protected_cluster_patterns = criteria.protected_cluster_patterns
+        excluded_namespace_patterns = criteria.excluded_namespace_patterns
+        extra_labels = criteria.extra_labels
+
+        # Calculate summary statistics
+        rule_count = 4  # Core deletion rules (missing expires, missing extra labels, expired, invalid format)
+        protected_cluster_count = len(protected_cluster_patterns)
+        excluded_namespace_count = len(excluded_namespace_patterns)
+        extra_labels_count = len(extra_labels)
+        time_format_count = 4  # h, d, w, y
+
+        # Determine configuration paths
+        kubeconfig_path = app.config["KUBECONFIG_PATH"]
+        config_path = app.config["CONFIG_PATH"]
+
+        html = render_template(
+            "rules.html",
+            # Summary statistics
+            rule_count=rule_count,
+            protected_cluster_count=protected_cluster_count,
+            excluded_namespace_count=excluded_namespace_count,
+            extra_labels_count=extra_labels_count,
+            time_format_count=time_format_count,
+            # Configuration details
+            protected_cluster_patterns=protected_cluster_patterns,
+            excluded_namespace_patterns=excluded_namespace_patterns,
+            extra_labels=extra_labels,
+            kubeconfig_path=kubeconfig_path,
+            grace_period=app.config["GRACE_PERIOD"],
+            config_path=config_path,
+        )
+        etag = hashlib.blake2b(html.encode("utf-8"), digest_size=8).hexdigest()
+        return html, etag
 
-    @app.route(url_prefix + "/rules")
+    @bp.route("/rules")
     def rules():
         """Display deletion rules and configuration summary."""
 
         try:
-            # Get cluster manager to access configuration
-            cluster_manager = get_cluster_manager()
-            config_manager = cluster_manager.config_manager
-            criteria = config_manager.get_criteria()
-
-            # Count various configuration elements
-            protected_cluster_patterns = criteria.protected_cluster_patterns
-            excluded_namespace_patterns = criteria.excluded_namespace_patterns
-            extra_labels = criteria.extra_labels
-
-            # Calculate summary statistics
-            rule_count = 4  # Core deletion rules (missing expires, missing extra labels, expired, invalid format)
-            protected_cluster_count = len(protected_cluster_patterns)
-            excluded_namespace_count = len(excluded_namespace_patterns)
-            extra_labels_count = len(extra_labels)
-            time_format_count = 4  # h, d, w, y
-
-            # Determine configuration paths
-            kubeconfig_path = app.config["KUBECONFIG_PATH"]
-            config_path = app.config["CONFIG_PATH"]
-
-            return render_template(
-                "rules.html",
-                no_redis=app.config["NO_REDIS"],
-                # Summary statistics
-                rule_count=rule_count,
-                protected_cluster_count=protected_cluster_count,
-                excluded_namespace_count=excluded_namespace_count,
-                extra_labels_count=extra_labels_count,
-                time_format_count=time_format_count,
-                # Configuration details
-                protected_cluster_patterns=protected_cluster_patterns,
-                excluded_namespace_patterns=excluded_namespace_patterns,
-                extra_labels=extra_labels,
-                kubeconfig_path=kubeconfig_path,
-                grace_period=app.config["GRACE_PERIOD"],
-                version=__version__,
-                config_path=config_path,
-            )
+            html, etag = render_rules(get_config_mtime())
+            response = make_response(html)
+            response.headers["Cache-Control"] = "private, max-age=60"
+            response.set_etag(etag)
+            return response.make_conditional(request)
         except Exception as e:
-            # Render with error state
-            return render_template(
+            return render_error(
                 "rules.html",
-                no_redis=app.config["NO_REDIS"],
-                rule_count=4,
-                protected_cluster_count=0,
-                excluded_namespace_count=0,
-                extra_labels_count=0,
-                time_format_count=4,
-                protected_cluster_patterns=[],
-                excluded_namespace_patterns=[],
-                extra_labels=[],
+                e,
                 kubeconfig_path=app.config["KUBECONFIG_PATH"],
                 grace_period=app.config["GRACE_PERIOD"],
                 config_path=app.config["CONFIG_PATH"],
-                version=__version__,
-                error=str(e),
             )
 
-    @app.route(url_prefix + "/scheduled-tasks")
+    @bp.route("/scheduled-tasks")
     def scheduled_tasks():
         """Display scheduled tasks (CronJobs) and recent executions."""
 
         try:
-            # Get cronjob manager
-            cronjob_manager = get_cronjob_manager()
-
             # Get summary
             namespace = "kommander"  # Default namespace for NKP cronjobs
-            summary = cronjob_manager.get_all_scheduled_tasks_summary(namespace)
+            summary = get_scheduled_tasks_summary(namespace)
 
             return render_template(
                 "scheduled_tasks.html",
-                no_redis=app.config["NO_REDIS"],
                 summary=summary,
                 namespace=namespace,
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                version=__version__,
                 error=None,
             )
         except Exception as e:
-            # Render error state
-            return render_template(
-                "scheduled_tasks.html",
-                no_redis=app.config["NO_REDIS"],
-                summary={
-                    "total_cronjobs": 0,
-                    "active_cronjobs": 0,
-                    "suspended_cronjobs": 0,
-                    "total_recent_jobs": 0,
-                    "successful_jobs": 0,
-                    "failed_jobs": 0,
-                    "running_jobs": 0,
-                    "cronjobs": [],
-                    "recent_jobs": [],
-                },
-                namespace="kommander",
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                version=__version__,
-                error=str(e),
-            )
+            return render_error("scheduled_tasks.html", e, namespace="kommander")
 
-    @app.route(url_prefix + "/api/job-logs")
+    @bp.route("/api/job-logs")
     def api_job_logs():
         """API endpoint to get logs for a specific job."""
         job_name = request.args.get("job_name")
@@ -407,75 +860,23 @@ def create_app(
 
             # First validate that this job was created by one of our CronJobs
             try:
-                job = cronjob_manager.batch_v1.read_namespaced_job(
-                    name=job_name, namespace=namespace
-                )
-
-                # Check if job was created by our CronJobs
-                is_our_job = False
-                if job.metadata.owner_references:
-                    for owner in job.metadata.owner_references:
-                        if owner.kind == "CronJob":
-                            try:
-                                cronjob = (
-                                    cronjob_manager.batch_v1.read_namespaced_cron_job(
-                                        name=owner.name, namespace=namespace
-                                    )
-                                )
-                                labels = cronjob.metadata.labels or {}
-                                if labels.get("app") == "nkp-cluster-cleaner":
-                                    is_our_job = True
-                                    break
-                            except:
-                                continue
-
-                if not is_our_job:
-                    return jsonify(
-                        {
-                            "status": "error",
-                            "error": "Access denied: Job was not created by nkp-cluster-cleaner",
-                        }
-                    ), 403
-
+                is_our_job = cronjob_manager.is_managed_job(job_name, namespace)
             except Exception as e:
                 return jsonify(
                     {"status": "error", "error": f"Job not found or access denied: {e}"}
                 ), 404
 
-            # Get pods for the job
-            pods = cronjob_manager.get_job_pods(job_name, namespace)
-
-            logs_data = []
-            for pod in pods:
-                # Get logs for each container in each pod
-                if pod["container_statuses"]:
-                    for container in pod["container_statuses"]:
-                        logs = cronjob_manager.get_pod_logs(
-                            pod["name"],
-                            container["name"],
-                            namespace,
-                            tail_lines=200,
-                            job_name=job_name,
-                        )
-                        logs_data.append(
-                            {
-                                "pod_name": pod["name"],
-                                "container_name": container["name"],
-                                "logs": logs,
-                            }
-                        )
-                else:
-                    # Single container pod
-                    logs = cronjob_manager.get_pod_logs(
-                        pod["name"], None, namespace, tail_lines=200, job_name=job_name
-                    )
-                    logs_data.append(
-                        {
-                            "pod_name": pod["name"],
-                            "container_name": "default",
-                            "logs": logs,
-                        }
-                    )
+            if not is_our_job:
+                return jsonify(
+                    {
+                        "status": "error",
+                        "error": "Access denied: Job was not created by nkp-cluster-cleaner",
+                    }
+                ), 403
+
+            logs_data = cronjob_manager.get_job_logs(
+                job_name, namespace, tail_lines=200
+            )
 
             return jsonify(
                 {
@@ -483,7 +884,7 @@ def create_app(
                     "job_name": job_name,
                     "namespace": namespace,
                     "logs": logs_data,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": datetime.now(),
                 }
             )
 
@@ -492,23 +893,16 @@ def create_app(
                 {
                     "status": "error",
                     "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": datetime.now(),
                 }
             ), 500
 
-    @app.route(url_prefix + "/metrics")
+    @bp.route("/metrics")
     def metrics():
         """Prometheus metrics endpoint."""
         try:
-            if app.config["NO_REDIS"]:
-                # Create metrics service without analytics
-                metrics_service = PrometheusMetricsService()
-            else:
-                # Create metrics service with analytics
-                analytics_service = get_analytics_service()
-                metrics_service = PrometheusMetricsService(analytics_service)
-
-            metrics_output = metrics_service.generate_metrics()
+            # Served from memory, the service refreshes it in the background
+            metrics_output = get_metrics_service().get_latest_metrics()
             return metrics_output, 200, {"Content-Type": "text/plain; charset=utf-8"}
 
         except Exception as e:
@@ -517,43 +911,27 @@ def create_app(
             metrics_output = metrics_service._generate_error_metrics(str(e))
             return metrics_output, 200, {"Content-Type": "text/plain; charset=utf-8"}
 
-    @app.route(url_prefix + "/notifications")
+    @bp.route("/notifications")
     def notifications():
         """Display currently active notifications."""
         if app.config["NO_REDIS"]:
-            return render_template(
+            return render_error(
                 "notifications.html",
-                no_redis=app.config["NO_REDIS"],
-                error="Notifications feature requires Redis/analytics to be enabled.",
-                version=__version__,
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                critical_count=0,
-                warning_count=0,
-                total_count=0,
+                "Notifications feature requires Redis/analytics to be enabled.",
             )
 
         try:
             from .notification_manager import NotificationManager
-            from .notification_history import NotificationHistory
 
-            # Initialize managers
-            config_manager = (
-                ConfigManager(app.config["CONFIG_PATH"])
-                if app.config["CONFIG_PATH"]
-                else ConfigManager()
-            )
+            # Reuse the shared cluster manager and Redis connection
+            cluster_manager = get_cluster_manager()
             notification_manager = NotificationManager(
                 app.config["KUBECONFIG_PATH"],
-                config_manager,
+                cluster_manager.config_manager,
                 grace_period=app.config["GRACE_PERIOD"],
+                cluster_manager=cluster_manager,
             )
-            notification_history = NotificationHistory(
-                app.config["REDIS_HOST"],
-                app.config["REDIS_PORT"],
-                app.config["REDIS_DB"],
-                app.config["REDIS_USERNAME"],
-                app.config["REDIS_PASSWORD"],
-            )
+            notification_history = get_notification_history()
 
             # Default thresholds (these could be made configurable)
             warning_threshold = 80
@@ -592,7 +970,6 @@ def create_app(
 
             return render_template(
                 "notifications.html",
-                no_redis=app.config["NO_REDIS"],
                 critical_notifications=critical_notifications,
                 warning_notifications=warning_notifications,
                 critical_count=len(critical_notifications),
@@ -603,24 +980,13 @@ def create_app(
                 notification_stats=notification_stats,
                 active_notifications=active_notifications,
                 grace_period=app.config["GRACE_PERIOD"],
-                version=__version__,
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 error=None,
             )
 
         except Exception as e:
-            return render_template(
-                "notifications.html",
-                no_redis=app.config["NO_REDIS"],
-                error=str(e),
-                version=__version__,
-                refresh_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                critical_count=0,
-                warning_count=0,
-                total_count=0,
-            )
+            return render_error("notifications.html", e)
 
-    @app.route(url_prefix + "/api/delete-notification", methods=["POST"])
+    @bp.route("/api/delete-notification", methods=["POST"])
     def api_delete_notification():
         """API endpoint to delete a notification from Redis."""
         data = request.get_json()
@@ -642,15 +1008,7 @@ def create_app(
             ), 400
 
         try:
-            from .notification_history import NotificationHistory
-
-            notification_history = NotificationHistory(
-                app.config["REDIS_HOST"],
-                app.config["REDIS_PORT"],
-                app.config["REDIS_DB"],
-                app.config["REDIS_USERNAME"],
-                app.config["REDIS_PASSWORD"],
-            )
+            notification_history = get_notification_history()
 
             success = notification_history.clear_cluster_history(
                 cluster_name, namespace
@@ -674,7 +1032,7 @@ def create_app(
         except Exception as e:
             return jsonify({"status": "error", "error": str(e)}), 500
 
-    @app.route(url_prefix + "/api/trigger-cronjob", methods=["POST"])
+    @bp.route("/api/trigger-cronjob", methods=["POST"])
     def api_trigger_cronjob():
         """API endpoint to manually trigger a cronjob."""
         data = request.get_json()
@@ -692,6 +1050,8 @@ def create_app(
             result = cronjob_manager.trigger_cronjob(cronjob_name, namespace)
 
             if result["success"]:
+                # Show the new job straight away on the next page load
+                tasks_cache.clear()
                 return jsonify(
                     {
                         "status": "success",
@@ -699,7 +1059,7 @@ def create_app(
                         "job_name": result["job_name"],
                         "cronjob_name": result["cronjob_name"],
                         "namespace": result["namespace"],
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": datetime.now(),
                     }
                 )
             else:
@@ -707,7 +1067,7 @@ def create_app(
                     {
                         "status": "error",
                         "error": result["error"],
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": datetime.now(),
                     }
                 ), 400
 
@@ -716,13 +1076,27 @@ def create_app(
                 {
                     "status": "error",
                     "error": f"Unexpected error: {str(e)}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": datetime.now(),
                 }
             ), 500
 
     #
     # End of routes
     #
+    app.register_blueprint(bp)
+
+    # Prefixed URL of every view by endpoint name, templates link with
+    # {{ urls.<view> }} instead of calling url_for() on each render
+    app.add_template_global(
+        {
+            rule.endpoint.split(".", 1)[1]: rule.rule
+            for rule in app.url_map.iter_rules()
+            if rule.endpoint.startswith(bp.name + ".")
+        },
+        "urls",
+    )
+    app.after_request(gzip_response)
+
     return app
 
 
@@ -740,9 +1114,14 @@ def run_server(
     redis_username: Optional[str] = None,
     redis_password: Optional[str] = None,
     no_redis: bool = False,
+    workers: int = GUNICORN_WORKERS,
+    threads: int = GUNICORN_THREADS,
 ):
     """
-    Run the Flask development server.
+    Run the web server.
+
+    In debug mode the Flask development server is used, otherwise the app is
+    served by gunicorn with threaded workers.
 
     Args:
         host: Host to bind to
@@ -758,54 +1137,97 @@ def run_server(
         redis_username: Redis username for authentication
         redis_password: Redis password for authentication
         no_redis: Disable analytics and Redis connections
+        workers: Number of gunicorn worker processes
+        threads: Number of request threads per worker
     """
 
-    app = create_app(
-        kubeconfig_path,
-        config_path,
-        url_prefix,
-        grace_period,
-        redis_host,
-        redis_port,
-        redis_db,
-        redis_username,
-        redis_password,
-        no_redis,
-    )
+    def app_factory() -> Flask:
+        return create_app(
+            kubeconfig_path,
+            config_path,
+            url_prefix,
+            grace_period,
+            redis_host,
+            redis_port,
+            redis_db,
+            redis_username,
+            redis_password,
+            no_redis,
+            debug,
+        )
 
     # Normalize prefix for display
-    display_prefix = url_prefix if url_prefix else ""
-
-    print("🚀 Starting NKP Cluster Cleaner web server...")
-    print(f"📡 Server URL: http://{host}:{port}{display_prefix}")
-    print(f"🔧 Debug mode: {'Enabled' if debug else 'Disabled'}")
-    print(
-        f"📋 Configuration: kubeconfig={kubeconfig_path or 'default'}, config={config_path or 'none'}"
-    )
+    url_prefix = _normalize_prefix(url_prefix)
+    base_url = f"http://{host}:{port}{url_prefix}"
+
+    lines = [
+        "🚀 Starting NKP Cluster Cleaner web server...",
+        f"📡 Server URL: {base_url}",
+        f"🔧 Debug mode: {'Enabled' if debug else 'Disabled'}",
+    ]
+    if not debug:
+        lines.append(f"👷 Workers: {workers} x {threads} threads")
+    lines += [
+        f"📋 Configuration: kubeconfig={kubeconfig_path or 'default'}, config={config_path or 'none'}",
+    ]
     if grace_period:
-        print(
+        lines.append(
             f"⏰ Grace period: {grace_period} (clusters younger than this will be excluded)"
         )
     if not no_redis:
-        print(
+        lines.append(
             f"📊 Analytics storage: Redis at {redis_host}:{redis_port} (db {redis_db})"
         )
     if url_prefix:
-        print(f"🔗 URL prefix: {url_prefix}")
-    print("🔗 Available endpoints:")
-    print(f"   • http://{host}:{port}{display_prefix}/ - Dashboard")
-    print(f"   • http://{host}:{port}{display_prefix}/clusters - Cluster listing")
-    print(f"   • http://{host}:{port}{display_prefix}/rules - Deletion rules")
+        lines.append(f"🔗 URL prefix: {url_prefix}")
+    lines.append("🔗 Available endpoints:")
+    lines.append(f"   • {base_url}/ - Dashboard")
+    lines.append(f"   • {base_url}/clusters - Cluster listing")
+    lines.append(f"   • {base_url}/rules - Deletion rules")
     if not no_redis:
-        print(
-            f"   • http://{host}:{port}{display_prefix}/analytics - Analytics dashboard"
-        )
-        print(
-            f"   • http://{host}:{port}{display_prefix}/notifications - Active notifications"
-        )
-    print(f"   • http://{host}:{port}{display_prefix}/metrics - Prometheus metrics")
-    print(f"   • http://{host}:{port}{display_prefix}/scheduled-tasks - CronJob status")
-    print(f"   • http://{host}:{port}{display_prefix}/health - Health check")
-    print("🛑 Press Ctrl+C to stop the server")
+        lines.append(f"   • {base_url}/analytics - Analytics dashboard")
+        lines.append(f"   • {base_url}/notifications - Active notifications")
+    lines.append(f"   • {base_url}/metrics - Prometheus metrics")
+    lines.append(f"   • {base_url}/scheduled-tasks - CronJob status")
+    lines.append(f"   • {base_url}/health - Health check")
+    lines.append("🛑 Press Ctrl+C to stop the server")
+
+    # Write the banner in one go so it isn't interleaved with worker output
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+    if debug:
+        app_factory().run(host=host, port=port, debug=debug)
+    else:
+        _run_gunicorn(app_factory, host, port, workers, threads)
+
+
+def _run_gunicorn(app_factory, host: str, port: int, workers: int, threads: int):
+    """
+    Serve the app with gunicorn.
+
+    The app is built by each worker after it has been forked, so Kubernetes
+    clients and Redis connection pools are never shared across processes.
+
+    Args:
+        app_factory: Callable returning the Flask app
+        host: Host to bind to
+        port: Port to bind to
+        workers: Number of worker processes
+        threads: Number of request threads per worker
+    """
+    from gunicorn.app.base import BaseApplication
+
+    class StandaloneApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", workers)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("threads", threads)
+            self.cfg.set("timeout", GUNICORN_TIMEOUT)
+            self.cfg.set("accesslog", "-")
+
+        def load(self):
+            return app_factory()
 
-    app.run(host=host, port=port, debug=debug)
+    StandaloneApplication().run()